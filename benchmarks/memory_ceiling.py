@@ -0,0 +1,192 @@
+"""Benchmark the peak memory of a run against the number of records a day.
+
+Every measurement runs a few days in a fresh process against a local mock
+of the Basecone API. The sync mode writes the Singer messages to /dev/null,
+the export mode writes Parquet files with one unbounded row group, so only
+the memory governor bounds its buffers. Every mode is measured without a
+ceiling, with a ceiling above the peak of the streamed run, which only
+measures the incremental decoding, and with a ceiling below the buffered
+peak, which also measures the backpressure, e.g.:
+
+    python benchmarks/memory_ceiling.py --records 1000 10000 100000
+"""
+# -*- coding: utf-8 -*-
+import argparse
+import json
+import os
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from typing import Generator, List, Optional, Tuple
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from tap_basecone.basecone import Basecone  # noqa: E402
+from tap_basecone.discover import discover  # noqa: E402
+from tap_basecone.export import export, pyarrow  # noqa: E402
+from tap_basecone.memory import MemoryGovernor  # noqa: E402
+from tap_basecone.sync import sync  # noqa: E402
+
+DAYS: int = 3
+CHUNK_RECORDS: int = 100
+
+# Ceilings in MiB: none, above the streamed peak and below the buffered peak
+CEILINGS: Tuple[Optional[int], ...] = (None, 256, 112)
+
+
+def transaction(index: int, date_day: str) -> dict:
+    """Create a Basecone transaction.
+
+    Arguments:
+        index {int} -- Number of the transaction
+        date_day {str} -- Transaction date
+
+    Returns:
+        dict -- Transaction
+    """
+    return {
+        'type': 'purchase',
+        'description': f'Transaction {index}',
+        'dueDate': f'{date_day}T00:00:00',
+        'invoiceNumber': f'INV-{index}',
+        'supplier': {'supplierId': f'S{index % 50}', 'code': '1', 'name': 'S'},
+        'isInPaymentBatch': False,
+        'isCreditNote': False,
+        'totalAmount': index * 1.25,
+        'transactionId': f'{date_day}-{index}',
+        'documentId': f'D{index}',
+        'targetCompany': {'code': '1'},
+        'destinationCompany': {'code': '2'},
+        'transactionNumber': str(index),
+        'transactionDate': f'{date_day}T00:00:00',
+        'generalLedger': {'generalLedgerId': 'G', 'code': '4000'},
+        'period': '1',
+        'currency': {'currencyId': 'C', 'code': 'EUR'},
+        'isFinalBooking': True,
+        'bookYear': date_day[:4],
+    }
+
+
+def response_body(date_day: str, records: int) -> Generator[bytes, None, None]:
+    """Generate a response body in chunks.
+
+    Arguments:
+        date_day {str} -- Transaction date
+        records {int} -- Number of transactions
+
+    Yields:
+        Generator[bytes] -- Chunks of the body
+    """
+    yield b'{"transactions": ['
+    for start in range(0, records, CHUNK_RECORDS):
+        chunk: str = ','.join(
+            json.dumps(transaction(index, date_day))
+            for index in range(start, min(start + CHUNK_RECORDS, records))
+        )
+        yield (',' if start else '').encode() + chunk.encode()
+    yield b']}'
+
+
+def measure(records: int, mode: str, max_rss_mb: Optional[int]) -> str:
+    """Run the days and return the peak memory of this process.
+
+    Arguments:
+        records {int} -- Number of transactions a day
+        mode {str} -- sync or export
+        max_rss_mb {Optional[int]} -- Memory ceiling in MiB
+
+    Returns:
+        str -- Peak resident set size in MiB and the number of flushes
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=response_body(
+            request.url.params['transactionDate'],
+            records,
+        ))
+
+    memory: Optional[MemoryGovernor] = None
+    if max_rss_mb:
+        memory = MemoryGovernor(max_rss_mb * 1024 * 1024)
+
+    basecone: Basecone = Basecone('company', 'token', memory=memory)
+    basecone.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    start_date: str = (date.today() - timedelta(days=DAYS - 1)).isoformat()
+    if mode == 'export':
+        with tempfile.TemporaryDirectory() as export_path:
+            export(basecone, {}, discover(), {
+                'export_path': export_path,
+                'start_date': start_date,
+                'row_group_size': records * DAYS,
+            })
+    else:
+        with open(os.devnull, 'w') as devnull:
+            with redirect_stdout(devnull):
+                sync(basecone, {}, discover(), start_date)
+
+    # Kilobytes on Linux
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+    return f'{peak} {memory.flushes if memory else 0}'
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--records',
+        type=int,
+        nargs='+',
+        default=[1000, 10000, 100000],
+    )
+    parser.add_argument('--measure', type=int)
+    parser.add_argument('--mode', default='sync')
+    parser.add_argument('--max-rss-mb', type=int)
+    args: argparse.Namespace = parser.parse_args()
+
+    # Child process of a single measurement
+    if args.measure is not None:
+        sys.stderr = open(os.devnull, 'w')  # noqa: WPS515
+        print(
+            measure(args.measure, args.mode, args.max_rss_mb),
+            file=sys.__stdout__,
+        )
+        return
+
+    # The export mode requires pyarrow
+    modes: Tuple[str, ...] = ('sync', 'export') if pyarrow else ('sync',)
+
+    print(
+        f'{"mode":>6} {"records/day":>12} {"ceiling MiB":>12} '
+        f'{"peak MiB":>9} {"flushes":>8}',
+    )
+    for mode in modes:
+        for records in args.records:
+            for max_rss_mb in CEILINGS:
+                command: List[str] = [
+                    sys.executable,
+                    __file__,
+                    '--measure',
+                    str(records),
+                    '--mode',
+                    mode,
+                ]
+                if max_rss_mb:
+                    command += ['--max-rss-mb', str(max_rss_mb)]
+
+                peak, flushes = subprocess.check_output(  # noqa: S603
+                    command,
+                    text=True,
+                ).split()
+                print(
+                    f'{mode:>6} {records:>12} {max_rss_mb or "-":>12} '
+                    f'{peak:>9} {flushes:>8}',
+                )
+
+
+if __name__ == '__main__':
+    main()
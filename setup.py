@@ -15,6 +15,12 @@ setup(
         'httpx',
         'httpx[http2]',
     ],
+    extras_require={
+        'memory': ['psutil'],
+        'msgspec': ['msgspec'],
+        'parquet': ['pyarrow'],
+        'zstd': ['zstandard'],
+    },
     entry_points="""
     [console_scripts]
     tap-basecone=tap_basecone:main
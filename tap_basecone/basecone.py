@@ -1,14 +1,46 @@
 """Basecone API Client."""
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
-from datetime import date, datetime, timedelta
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from types import MappingProxyType
-from typing import Callable, Generator, Optional
-from tap_basecone.cleaners import CLEANERS
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from tap_basecone.cleaners import CLEANERS, ConvertionError
+from tap_basecone.memory import MemoryGovernor
+from tap_basecone.partitions import COMPLETE, LeaseTable
+from tap_basecone.quarantine import DeadLetter
+from tap_basecone.structs import (
+    DECODERS,
+    DecodeError,
+    iter_items,
+    to_builtins,
+)
 from dateutil.rrule import DAILY, rrule
 import httpx
 import singer
+from singer import metrics
 
 API_SCHEME: str = 'https://'
 API_BASE_URL: str = 'api.basecone.com'
@@ -20,6 +52,168 @@ HEADERS: MappingProxyType = MappingProxyType({
     'Authorization': 'Basic :accesstoken:',
 })
 
+# Number of recent response times used for the hedging percentile
+HEDGE_WINDOW: int = 100
+HEDGE_MIN_SAMPLES: int = 10
+
+
+# Number of attempts of a day which is rate limited or failed on the server
+FETCH_ATTEMPTS: int = 5
+
+# Backoff before the next attempt, doubled every attempt
+BACKOFF_SECONDS: float = 1
+MAX_BACKOFF_SECONDS: float = 60
+
+# Key of the time until the response headers in the response extensions
+HEADERS_LATENCY: str = 'headers_latency'
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Return the delay before the next attempt of a failed request.
+
+    The Retry-After header of the response is honoured, in seconds or as
+    HTTP date. Otherwise the delay is an exponential backoff.
+
+    Arguments:
+        response {httpx.Response} -- Failed response
+        attempt {int} -- Number of the failed attempt, starting at 1
+
+    Returns:
+        float -- Delay in seconds
+    """
+    retry_after: Optional[str] = response.headers.get('Retry-After')
+
+    if retry_after:
+        try:
+            return min(MAX_BACKOFF_SECONDS, max(0, float(retry_after)))
+        except ValueError:
+            pass
+        try:
+            retry_date: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return min(MAX_BACKOFF_SECONDS, max(0, (
+                retry_date - datetime.now(timezone.utc)
+            ).total_seconds()))
+
+    return min(MAX_BACKOFF_SECONDS, BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+
+def close_response(future: Future) -> None:
+    """Close the response of a request which is not used.
+
+    Arguments:
+        future {Future} -- Future of the response
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class AdaptiveConcurrency(object):  # noqa: WPS230
+    """Tune the number of in-flight requests with AIMD.
+
+    The limit increases additively, by one request per window of healthy
+    responses, and decreases multiplicatively on 429 and 5xx responses,
+    errors and latency spikes. The baseline of the response times follows
+    every successful response, so a lasting change of the response times
+    stops counting as a spike after a few responses.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        latency_factor: float = 2.0,
+    ) -> None:
+        """Initialize adaptive concurrency.
+
+        Arguments:
+            maximum {int} -- Maximum number of in-flight requests
+
+        Keyword Arguments:
+            minimum {int} -- Minimum number of in-flight requests (default: 1)
+            latency_factor {float} -- Response time relative to the average
+                successful response time which is a spike (default: {2.0})
+        """
+        self.maximum: int = maximum
+        self.minimum: int = minimum
+        self.latency_factor: float = latency_factor
+        self.limit: float = minimum
+        self.latency: Optional[float] = None
+        self.decreased: float = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        """Current number of in-flight requests.
+
+        Returns:
+            int -- Number of requests
+        """
+        return int(self.limit)
+
+    def on_response(self, latency: float, status_code: Optional[int]) -> None:
+        """Adjust the limit after a response.
+
+        Arguments:
+            latency {float} -- Time until the response headers in seconds
+            status_code {Optional[int]} -- Status code, None on errors
+        """
+        with self.lock:
+            healthy: bool = status_code is not None and (
+                status_code != 429 and status_code < 500  # noqa: WPS432
+            )
+            spike: bool = self.latency is not None and (
+                latency > self.latency_factor * self.latency
+            )
+
+            # Moving average of the successful response times, including
+            # spikes, so the baseline follows a lasting change
+            if healthy:
+                if self.latency is None:
+                    self.latency = latency
+                else:
+                    self.latency = 0.9 * self.latency + 0.1 * latency
+
+            if healthy and not spike:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                return
+
+            # Decrease once for the requests which were in flight together
+            now: float = time.monotonic()
+            if now - self.decreased < (self.latency or 0):
+                return
+
+            self.decreased = now
+            self.limit = max(self.minimum, self.limit / 2)
+
+
+class RateLimiter(object):
+    """Limit the rate of requests, shared by all streams and threads."""
+
+    def __init__(self, rate: float) -> None:
+        """Initialize rate limiter.
+
+        Arguments:
+            rate {float} -- Maximum number of requests per second
+        """
+        self.interval: float = 1 / rate
+        self.next_slot: float = time.monotonic()
+        self.lock: threading.Lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a slot for a request.
+
+        Returns:
+            float -- Seconds to wait before the request is sent
+        """
+        with self.lock:
+            now: float = time.monotonic()
+            slot: float = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+            return slot - now
+
 
 class Basecone(object):  # noqa: WPS230
     """Basecone API Client."""
@@ -28,23 +222,128 @@ class Basecone(object):  # noqa: WPS230
         self,
         company_id: str,
         auth_token: str,
+        max_runtime: Optional[float] = None,
+        max_requests: Optional[int] = None,
+        freshness_days: Optional[int] = None,
+        end_date: Optional[str] = None,
+        leases: Optional[LeaseTable] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_max_ratio: float = 0.1,
+        dead_letter: Optional[DeadLetter] = None,
+        typed_decoding: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_concurrency: Optional[int] = None,
+        memory: Optional[MemoryGovernor] = None,
     ) -> None:
         """Initialize Basecone client.
 
         Arguments:
             company_id {str} -- Basecone company account
             auth_token {str} -- Base64 encoded Token
+
+        Keyword Arguments:
+            max_runtime {Optional[float]} -- Seconds after which no new day is
+                retrieved (default: {None})
+            max_requests {Optional[int]} -- Number of requests after which no
+                new day is retrieved (default: {None})
+            freshness_days {Optional[int]} -- Number of most recent days which
+                are retrieved before older days (default: {None})
+            end_date {Optional[str]} -- Last day to retrieve instead of today,
+                e.g. 2021-12-31 (default: {None})
+            leases {Optional[LeaseTable]} -- Lease table to share the days
+                with other nodes (default: {None})
+            hedge_percentile {Optional[float]} -- Percentile of the recent
+                response times, e.g. 0.95, after which a duplicate request is
+                sent (default: {None})
+            hedge_max_ratio {float} -- Maximum number of duplicate requests
+                relative to all requests (default: {0.1})
+            dead_letter {Optional[DeadLetter]} -- Quarantine for rows which
+                can not be cleaned, instead of failing (default: {None})
+            typed_decoding {bool} -- Decode responses into typed structs when
+                msgspec is installed (default: {False})
+            rate_limiter {Optional[RateLimiter]} -- Rate limiter shared by the
+                streams and clients (default: {None})
+            max_concurrency {Optional[int]} -- Maximum number of days which
+                are requested concurrently, the number is tuned on the
+                response times and errors (default: {None})
+            memory {Optional[MemoryGovernor]} -- Memory governor, responses
+                are then decoded while they are received (default: {None})
         """
         self.company_id: str = company_id
         self.auth_token: str = auth_token
         self.token: Optional[str] = None
 
+        # Setup the budget of the run
+        self.max_runtime: Optional[float] = max_runtime
+        self.max_requests: Optional[int] = max_requests
+        self.started: float = time.monotonic()
+        self.requests: int = 0
+
+        # Retrieve the most recent days first
+        self.freshness_days: Optional[int] = freshness_days
+
+        # Retrieve the days until the end_date, shared with other nodes
+        self.end_date: Optional[str] = end_date
+        self.leases: Optional[LeaseTable] = leases
+
+        # Setup request hedging
+        self.hedge_percentile: Optional[float] = hedge_percentile
+        self.hedge_max_ratio: float = hedge_max_ratio
+        self.hedges: int = 0
+        self.latencies: deque = deque(maxlen=HEDGE_WINDOW)
+
+        # Every concurrent request and its hedge have their own worker, so
+        # no request waits in the queue of the pool
+        self.executor: Optional[ThreadPoolExecutor] = None
+        if hedge_percentile:
+            self.executor = ThreadPoolExecutor(
+                max_workers=2 * max(max_concurrency or 1, 2),
+            )
+
+        # Setup quarantine
+        self.dead_letter: Optional[DeadLetter] = dead_letter
+
+        # Setup typed decoders of the responses
+        self.decoders: dict = DECODERS if typed_decoding else {}
+
+        # Setup the rate limit, the counters are shared by concurrent streams
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.lock: threading.Lock = threading.Lock()
+        self.memory: Optional[MemoryGovernor] = memory
+
+        # Setup concurrent requests of days
+        self.concurrency: Optional[AdaptiveConcurrency] = None
+        self.fetch_executor: Optional[ThreadPoolExecutor] = None
+        if max_concurrency and max_concurrency > 1:
+            self.concurrency = AdaptiveConcurrency(max_concurrency)
+            self.fetch_executor = ThreadPoolExecutor(
+                max_workers=max_concurrency,
+            )
+
+        # The state to resume from per stream, after every retrieved day
+        self.checkpoints: dict = {}
+
+        # Retrieved days per stream whose leases are completed on commit,
+        # their leases are renewed while the rows are not yet written
+        self.uncommitted: Dict[str, List[str]] = {}
+        self.renewed: float = time.monotonic()
+
+        # The cleaners per stream, which can be replaced by projected cleaners
+        self.cleaners: dict = dict(CLEANERS)
+
         # Setup reusable web client
-        self.client: httpx.Client = httpx.Client(http2=True)
+        self.client: httpx.Client = self._create_client()
 
         # Setup logger
         self.logger: logging.RootLogger = singer.get_logger()
 
+        # Streamed responses are decoded incrementally into dictionaries
+        if self.memory and self.decoders:
+            self.logger.warning(
+                'Typed decoding is not used, since the responses are '
+                'decoded while they are received with a memory ceiling',
+            )
+
         # Perform authentication during initialising
         self.create_header()
 
@@ -62,61 +361,86 @@ class Basecone(object):  # noqa: WPS230
         """
         self.logger.info('Stream Basecone transactions')
 
-        cleaner: Callable = CLEANERS.get('transaction_collection', {})
+        cleaner: Callable = self.cleaners.get('transaction_collection', {})
 
-        # Validate the start_date value exists
-        start_date_input: str = str(kwargs.get('start_date', ''))
+        response: httpx._models.Response  # noqa: WPS437
+        for date_day, checkpoint, response in self._fetch_days(
+            self._transaction_days(**kwargs),
+            self._transaction_url,
+        ):
+            if response.status_code == 404:  # noqa: WPS432
+                self.logger.info(
+                    f'Transactions with date: {date_day} not '
+                    'found, stopping.',
+                )
+                response.close()
+                self._day_aborted(date_day)
+                break
+            elif response.status_code != 200:
+                response.close()
+                self._raise_for_day(date_day, response)
 
-        if not start_date_input:
-            raise ValueError('The parameter start_date is required.')
+            try:
+                yield from self._clean_rows(
+                    'transaction_collection',
+                    date_day,
+                    cleaner,
+                    self._decode_transactions(response),
+                )
+            finally:
+                response.close()
 
-        parsed_date: datetime = datetime.strptime(start_date_input, '%Y-%m-%d')
+            # The day is completely retrieved
+            self._day_completed('transaction_collection', date_day, checkpoint)
 
-        # Replace placeholder in reports path
-        company: str = API_COMPANY_ID.replace(
-            ':id:',
-            self.company_id,
-        )
-        client: httpx.Client = httpx.Client(http2=True)
-        
-        for date_day in self._start_days_till_now(start_date_input):
-            
-            report_date: str = API_REPORT_DATE.replace(
-                ':date:',
-                str(date_day),
-            )
+    def budget_exhausted(self) -> bool:
+        """Whether the runtime or request budget of the run is spent.
 
-            # Create the URL
-            url: str = (
-                f'{API_SCHEME}{API_BASE_URL}'
-                f'{API_VERSION}/{API_REPORT_PATH}'
-                f'{company}{report_date}'
-            )
+        Returns:
+            bool -- The budget is spent
+        """
+        if self.max_requests is not None and (
+            self.requests >= self.max_requests
+        ):
+            return True
 
-            self.logger.info(
-                f'Recieving Basecone transactions from {date_day}'
-            )
+        return self.max_runtime is not None and (
+            time.monotonic() - self.started >= self.max_runtime
+        )
 
-            response: httpx._models.Response = client.get(  # noqa: WPS437
-                url,
-                headers=self.headers,
-            )
+    def start_run(self) -> None:
+        """Reset the budget and counts for a new run of a long-lived client."""
+        self.started = time.monotonic()
+        self.requests = 0
+        self.hedges = 0
+        self.checkpoints = {}
 
-            jsondata = response.json()
+        # Days of a failed run are retrieved again
+        for days in self.uncommitted.values():
+            for date_day in days:
+                self._day_aborted(date_day)
+        self.uncommitted = {}
 
-            if response.status_code == 200:
+        if self.dead_letter:
+            self.dead_letter.count = 0
 
-                yield from (
-                    cleaner(transaction)
-                    for transaction in jsondata['transactions']
-                )
+    def summary(self) -> dict:
+        """Return the counts of the run.
 
-            elif response.status_code == 404:  # noqa: WPS432
-                self.logger.info(
-                    f'Transactions with date: {date} not '
-                    'found, stopping.',
-                )
-                break
+        Returns:
+            dict -- Counts of the run
+        """
+        return {
+            'requests': self.requests,
+            'hedged_requests': self.hedges,
+            'quarantined_rows': (
+                self.dead_letter.count if self.dead_letter else 0
+            ),
+            'concurrency': (
+                self.concurrency.current if self.concurrency else 1
+            ),
+            **(self.memory.summary() if self.memory else {}),
+        }
 
     def create_header(self) -> None:
         """Generate a basic access token header."""
@@ -128,14 +452,669 @@ class Basecone(object):  # noqa: WPS230
         )
         self.headers = headers
 
+    def _stop(self, date_day: str) -> None:
+        """Log that the budget of the run is spent.
+
+        The checkpoint of the last retrieved day is the state to resume from.
+
+        Arguments:
+            date_day {str} -- First day which was not retrieved
+        """
+        self.logger.info(
+            f'Budget of the run is spent after {self.requests} requests, '
+            f'stopping before {date_day}.',
+        )
+
+    def _clean_rows(
+        self,
+        stream_name: str,
+        date_day: str,
+        cleaner: Callable,
+        rows: list,
+    ) -> Generator[dict, None, None]:
+        """Clean the rows, or quarantine the rows which can not be cleaned.
+
+        Arguments:
+            stream_name {str} -- Stream name
+            date_day {str} -- Day of the request
+            cleaner {Callable} -- Cleaner
+            rows {list} -- Raw rows
+
+        Raises:
+            ConvertionError: The row can not be cleaned without quarantine
+
+        Yields:
+            Generator[dict] -- Cleaned rows
+        """
+        for row in rows:
+            try:
+                cleaned: dict = cleaner(row)
+            except ConvertionError as err:
+                if self.dead_letter is None:
+                    raise
+                self.dead_letter.write(
+                    stream_name,
+                    date_day,
+                    to_builtins(row),
+                    err,
+                )
+                continue
+            yield cleaned
+
+    def _fetch_days(  # noqa: WPS210, WPS231
+        self,
+        days: Iterator[Tuple[str, dict]],
+        url: Callable[[str], str],
+    ) -> Generator[Tuple[str, dict, httpx.Response], None, None]:
+        """Request the days and yield the responses in order of the days.
+
+        No new day is requested once the budget of the run is spent. With
+        adaptive concurrency, the next days are requested while the current
+        day is processed. Days which are rate limited or failed on the
+        server are requested again after a backoff, the response of the last
+        attempt is yielded.
+
+        Arguments:
+            days {Iterator[Tuple[str, dict]]} -- Days with their state
+            url {Callable[[str], str]} -- Creates the URL of a day
+
+        Yields:
+            Generator[Tuple[str, dict, httpx.Response]] -- Every day with its
+                state and response
+        """
+        pending: deque = deque()
+        exhausted: bool = False
+
+        try:
+            while True:
+                limit: int = self.concurrency.current if (
+                    self.concurrency
+                ) else 1
+
+                # Request the next days up to the concurrency limit
+                while not exhausted and len(pending) < limit:
+                    # Pause the next requests under memory pressure
+                    if self.memory and self.memory.relieve() and pending:
+                        break
+
+                    day: Optional[Tuple[str, dict]] = next(days, None)
+
+                    if day is None:
+                        exhausted = True
+                    elif self.budget_exhausted():
+                        # Stop at the day boundary when the budget is spent
+                        self._stop(day[0])
+                        self._day_aborted(day[0])
+                        exhausted = True
+                    else:
+                        self.logger.info(
+                            f'Recieving Basecone transactions from {day[0]}'
+                        )
+                        pending.append((day, 1, self._submit(url(day[0]))))
+
+                if not pending:
+                    return
+
+                (date_day, checkpoint), attempt, future = pending.popleft()
+                try:
+                    response: httpx.Response = future.result()
+                except Exception:
+                    self._day_aborted(date_day)
+                    raise
+
+                # Request the day again when it is rate limited
+                if attempt < FETCH_ATTEMPTS and (
+                    response.status_code == 429  # noqa: WPS432
+                    or response.status_code >= 500  # noqa: WPS432
+                ):
+                    delay: float = retry_delay(response, attempt)
+                    self.logger.info(
+                        f'Requesting {date_day} again in {delay:.1f} '
+                        f'seconds after status {response.status_code}',
+                    )
+                    response.close()
+                    pending.appendleft((
+                        (date_day, checkpoint),
+                        attempt + 1,
+                        self._submit(url(date_day), delay),
+                    ))
+                    continue
+
+                yield date_day, checkpoint, response
+        finally:
+            # Release the days which were requested, but not processed
+            for (date_day, _), _, future in pending:
+                if not future.cancel():
+                    future.add_done_callback(close_response)
+                self._day_aborted(date_day)
+
+    def _submit(self, url: str, delay: float = 0) -> Future:
+        """Send a GET request, concurrently with adaptive concurrency.
+
+        Arguments:
+            url {str} -- URL
+
+        Keyword Arguments:
+            delay {float} -- Seconds to wait before the request (default: 0)
+
+        Returns:
+            Future -- Future of the response
+        """
+        if self.fetch_executor is None:
+            future: Future = Future()
+            try:
+                time.sleep(delay)
+                future.set_result(self._get(url))
+            except Exception as err:
+                future.set_exception(err)
+            return future
+
+        return self.fetch_executor.submit(self._adaptive_get, url, delay)
+
+    def _adaptive_get(self, url: str, delay: float = 0) -> httpx.Response:
+        """Send a GET request and adjust the concurrency on its outcome.
+
+        Arguments:
+            url {str} -- URL
+
+        Keyword Arguments:
+            delay {float} -- Seconds to wait before the request (default: 0)
+
+        Raises:
+            httpx.HTTPError: The request failed
+
+        Returns:
+            httpx.Response -- Response
+        """
+        time.sleep(delay)
+
+        started: float = time.monotonic()
+        previous: int = self.concurrency.current
+
+        try:
+            response: httpx.Response = self._get(url)
+        except httpx.HTTPError:
+            self.concurrency.on_response(time.monotonic() - started, None)
+            raise
+
+        # The time until the headers, the size of the body does not count
+        self.concurrency.on_response(
+            response.extensions[HEADERS_LATENCY],
+            response.status_code,
+        )
+
+        if self.concurrency.current != previous:
+            metrics.log(self.logger, metrics.Point(
+                'gauge',
+                'concurrency',
+                self.concurrency.current,
+                {'endpoint': API_REPORT_PATH},
+            ))
+
+        return response
+
+    def _decode_transactions(self, response: httpx.Response) -> Iterable:
+        """Decode the transactions of a response.
+
+        With a typed decoder, the response bytes are decoded straight into
+        structs. Responses which do not match the structs are decoded as
+        JSON. Streamed responses are decoded while they are received.
+
+        Arguments:
+            response {httpx.Response} -- Response
+
+        Returns:
+            Iterable -- Transactions
+        """
+        if not response.is_closed:
+            return self._stream_transactions(response)
+
+        decoder: Optional[Any] = self.decoders.get('transaction_collection')
+
+        if decoder is not None:
+            try:
+                return decoder.decode(response.content).transactions
+            except DecodeError as err:
+                self.logger.warning(f'Decoding as JSON, since: {err}')
+
+        return response.json()['transactions']
+
+    def _stream_transactions(
+        self,
+        response: httpx.Response,
+    ) -> Generator[dict, None, None]:
+        """Decode the transactions of a streamed response one by one.
+
+        The memory is relieved after every received chunk.
+
+        Arguments:
+            response {httpx.Response} -- Streamed response
+
+        Yields:
+            Generator[dict] -- Transactions
+        """
+        try:
+            for transaction in iter_items(
+                self._relieved_chunks(response),
+                'transactions',
+            ):
+                yield transaction
+        finally:
+            response.close()
+
+    def _relieved_chunks(
+        self,
+        response: httpx.Response,
+    ) -> Generator[bytes, None, None]:
+        """Receive the chunks of a response and relieve the memory.
+
+        Arguments:
+            response {httpx.Response} -- Streamed response
+
+        Yields:
+            Generator[bytes] -- Chunks of the body
+        """
+        for chunk in response.iter_bytes():
+            if self.memory:
+                self.memory.relieve()
+            yield chunk
+
+    def _get(self, url: str) -> httpx.Response:
+        """Send a GET request, hedged when it takes unusually long.
+
+        When hedging is enabled and the request does not respond within the
+        hedge_percentile of the recent response times, a duplicate request is
+        sent over the same HTTP/2 connection. The first response wins, the
+        other request finishes in the background.
+
+        Arguments:
+            url {str} -- URL
+
+        Returns:
+            httpx.Response -- Response
+        """
+        delay: Optional[float] = self._hedge_delay()
+        if delay is None:
+            return self._timed_get(url)
+
+        primary: Future = self.executor.submit(self._timed_get, url)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._may_hedge():
+            return primary.result()
+
+        with self.lock:
+            self.hedges += 1
+        self.logger.info(f'Hedging request after {delay:.2f} seconds: {url}')
+
+        hedge: Future = self.executor.submit(self._timed_get, url)
+        done, pending = wait([primary, hedge], return_when=FIRST_COMPLETED)
+
+        # Use the other request when the first one failed
+        winner: Future = done.pop()
+        if winner.exception() is not None and pending:
+            winner = pending.pop()
+
+        # Close the response of the other request when it arrives
+        for other in (primary, hedge):
+            if other is not winner:
+                other.add_done_callback(close_response)
+        return winner.result()
+
+    def _timed_get(self, url: str) -> httpx.Response:
+        """Send a GET request and save its response time.
+
+        The time until the headers are received is saved in the extensions
+        of the response.
+
+        Arguments:
+            url {str} -- URL
+
+        Returns:
+            httpx.Response -- Response
+        """
+        if self.rate_limiter:
+            time.sleep(self.rate_limiter.reserve())
+
+        with self.lock:
+            self.requests += 1
+
+        started: float = time.monotonic()
+        response: httpx.Response = self.client.send(
+            self.client.build_request('GET', url, headers=self.headers),
+            stream=True,
+        )
+        response.extensions[HEADERS_LATENCY] = time.monotonic() - started
+
+        # With a memory ceiling, the body is decoded while it is received
+        if not self.memory:
+            try:
+                response.read()
+            finally:
+                response.close()
+        self.latencies.append(time.monotonic() - started)
+        return response
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Return the response time after which a request is hedged.
+
+        Returns:
+            Optional[float] -- Seconds, None when hedging is disabled
+        """
+        if not self.hedge_percentile:
+            return None
+        elif len(self.latencies) < HEDGE_MIN_SAMPLES:
+            return None
+
+        latencies: list = sorted(self.latencies)
+        return latencies[int(self.hedge_percentile * (len(latencies) - 1))]
+
+    def _may_hedge(self) -> bool:
+        """Whether a duplicate request fits in the maximum extra load.
+
+        Returns:
+            bool -- A request may be hedged
+        """
+        return self.hedges < self.hedge_max_ratio * self.requests
+
+    def _day_completed(
+        self,
+        stream_name: str,
+        date_day: str,
+        checkpoint: dict,
+    ) -> None:
+        """Save the state after a day is completely retrieved.
+
+        Arguments:
+            stream_name {str} -- Stream name
+            date_day {str} -- Retrieved day
+            checkpoint {dict} -- State to resume from
+        """
+        if self.leases:
+            self.uncommitted.setdefault(stream_name, []).append(date_day)
+            self._renew_leases()
+        self.checkpoints[stream_name] = checkpoint
+
+    def _renew_leases(self) -> None:
+        """Renew the leases of the uncommitted days after half a lease.
+
+        Days whose lease is lost are retrieved by another node, so they are
+        no longer completed by this node.
+        """
+        now: float = time.monotonic()
+        if now - self.renewed < self.leases.lease_seconds / 2:
+            return
+        self.renewed = now
+
+        for stream_name, days in self.uncommitted.items():
+            lost: List[str] = self.leases.renew(days)
+            if lost:
+                self.logger.warning(
+                    f'Lost the leases of {stream_name} days {lost} '
+                    'before their rows were written',
+                )
+                self.uncommitted[stream_name] = [
+                    date_day for date_day in days if date_day not in lost
+                ]
+
+    def commit(self, stream_name: str) -> Optional[dict]:
+        """Return the checkpoint of a stream once its rows are written.
+
+        Call this when the rows up to the checkpoint are durably written.
+        The leases of the retrieved days are then completed, except for the
+        days from today, which are released to be retrieved again.
+
+        Arguments:
+            stream_name {str} -- Stream name
+
+        Returns:
+            Optional[dict] -- State to resume from, None without new state
+        """
+        today: str = datetime.utcnow().date().isoformat()
+
+        for date_day in self.uncommitted.pop(stream_name, []):
+            if date_day >= today:
+                self.leases.release(date_day)
+            elif not self.leases.complete(date_day):
+                self.logger.warning(
+                    f'Lost the lease of {stream_name} day {date_day} '
+                    'before its rows were written, it may be retrieved twice',
+                )
+
+        return self.checkpoints.pop(stream_name, None)
+
+    def _raise_for_day(
+        self,
+        date_day: str,
+        response: httpx.Response,
+    ) -> None:
+        """Abort the day of a failed response and raise its error.
+
+        The state stays on the failed day, so it is retrieved again by the
+        next run.
+
+        Arguments:
+            date_day {str} -- Day of the request
+            response {httpx.Response} -- Failed response
+
+        Raises:
+            httpx.HTTPStatusError: The response is not successful
+        """
+        self._day_aborted(date_day)
+        response.raise_for_status()
+        raise httpx.HTTPStatusError(
+            f'Unexpected status {response.status_code} for {date_day}',
+            request=response.request,
+            response=response,
+        )
+
+    def _day_aborted(self, date_day: str) -> None:
+        """Release the day when it is not retrieved.
+
+        Arguments:
+            date_day {str} -- Day which is not retrieved
+        """
+        if self.leases:
+            self.leases.release(date_day)
+
+    def _create_client(self) -> httpx.Client:
+        """Create the reusable web client.
+
+        Returns:
+            httpx.Client -- Web client
+        """
+        return httpx.Client(http2=True)
+
+    def _transaction_days(  # noqa: WPS210
+        self,
+        **kwargs: dict,
+    ) -> Generator[Tuple[str, dict], None, None]:
+        """Validate the state and yield the days to retrieve.
+
+        Every day is yielded with the state to resume from after the day is
+        retrieved. In freshness mode, the most recent days are retrieved
+        before the backlog. The state then contains:
+        - start_date: The first day of the backlog which is not retrieved
+        - fresh_date: The first recent day which is not retrieved
+        - backlog_end_date: The first day after the backlog
+        Once the backlog is retrieved, only the start_date remains.
+
+        Arguments:
+            start_date {str} -- String which contains the date
+            fresh_date {str} -- Optional, the fresh edge
+            backlog_end_date {str} -- Optional, the end of the backlog
+
+        Raises:
+            ValueError: The start_date is missing
+
+        Yields:
+            Generator[Tuple[str, dict]] -- Every day until now with its state
+        """
+        # Validate the start_date value exists
+        start_date_input: str = str(kwargs.get('start_date', ''))
+
+        if not start_date_input:
+            raise ValueError('The parameter start_date is required.')
+
+        # Validate the format of the start_date
+        datetime.strptime(start_date_input, '%Y-%m-%d')
+
+        # Share the days with other nodes
+        if self.leases:
+            yield from self._partition_days(
+                start_date_input,
+                dict(kwargs.get('partitions') or {}),
+            )
+            return
+
+        fresh_date: Optional[str] = kwargs.get('fresh_date')
+        backlog_end_date: Optional[str] = kwargs.get('backlog_end_date')
+
+        # Split the days in recent days and a backlog
+        if not fresh_date and self.freshness_days:
+            fresh_start: str = (
+                datetime.utcnow().date()
+                - timedelta(days=self.freshness_days - 1)
+            ).isoformat()
+
+            if start_date_input < fresh_start:
+                fresh_date = fresh_start
+                backlog_end_date = fresh_start
+
+        # Without (remaining) backlog, all days are retrieved in order
+        if not fresh_date or start_date_input >= str(backlog_end_date):
+            start_date_input = max(start_date_input, fresh_date or '')
+            yield from (
+                (date_day, {'start_date': self._next_day(date_day)})
+                for date_day in self._start_days_till_now(start_date_input)
+            )
+            return
+
+        self.logger.info(
+            f'Retrieving the days from {fresh_date} before the backlog from '
+            f'{start_date_input} till {backlog_end_date}',
+        )
+
+        # Retrieve the recent days first
+        for date_day in self._start_days_till_now(fresh_date):
+            fresh_date = self._next_day(date_day)
+            yield date_day, {
+                'start_date': start_date_input,
+                'fresh_date': fresh_date,
+                'backlog_end_date': backlog_end_date,
+            }
+
+        # Then fill the backlog
+        for date_day in self._start_days_till_now(start_date_input):
+            next_day: str = self._next_day(date_day)
+
+            if next_day >= backlog_end_date:
+                yield date_day, {'start_date': fresh_date}
+                return
+
+            yield date_day, {
+                'start_date': next_day,
+                'fresh_date': fresh_date,
+                'backlog_end_date': backlog_end_date,
+            }
+
+    def _partition_days(
+        self,
+        start_date: str,
+        partitions: dict,
+    ) -> Generator[Tuple[str, dict], None, None]:
+        """Yield the days which are claimed in the lease table.
+
+        The state contains the start_date before which all days are complete
+        and the partitions, a map of the completed days after the start_date.
+        Days which are claimed by another node are skipped.
+
+        Arguments:
+            start_date {str} -- First day which is not complete
+            partitions {dict} -- Completed days, e.g. {'2021-01-02': 'complete'}
+
+        Yields:
+            Generator[Tuple[str, dict]] -- Every claimed day with its state
+        """
+        today: str = datetime.utcnow().date().isoformat()
+
+        for date_day in self._start_days_till_now(start_date):
+            if date_day in partitions:
+                continue
+
+            claim: Optional[bool] = self.leases.claim(date_day)
+            if claim is False:
+                self.logger.info(f'Day {date_day} is claimed by another node')
+                continue
+
+            # Today is not complete yet, so it is retrieved again
+            if date_day < today:
+                partitions[date_day] = COMPLETE
+
+            # Move the start_date past the days which are complete
+            while start_date in partitions:
+                partitions.pop(start_date)
+                start_date = self._next_day(start_date)
+
+            # Days which were completed by another node are not retrieved
+            if claim is None:
+                continue
+
+            yield date_day, {
+                'start_date': start_date,
+                'partitions': dict(partitions),
+            }
+
+    def _transaction_url(self, date_day: str) -> str:
+        """Create the URL of the transactions of a day.
+
+        Arguments:
+            date_day {str} -- Day in YYYY-MM-DD format
+
+        Returns:
+            str -- URL
+        """
+        # Replace placeholders in reports path
+        company: str = API_COMPANY_ID.replace(
+            ':id:',
+            self.company_id,
+        )
+        report_date: str = API_REPORT_DATE.replace(
+            ':date:',
+            str(date_day),
+        )
+
+        return (
+            f'{API_SCHEME}{API_BASE_URL}'
+            f'{API_VERSION}/{API_REPORT_PATH}'
+            f'{company}{report_date}'
+        )
+
+    def _next_day(self, date_day: str) -> str:
+        """Return the day to resume from after a day is retrieved.
+
+        Today is not complete yet, so it is retrieved again in the next run.
+
+        Arguments:
+            date_day {str} -- Day in YYYY-MM-DD format
+
+        Returns:
+            str -- The next day, but not later than today
+        """
+        next_day: date = datetime.strptime(
+            date_day,
+            '%Y-%m-%d',
+        ).date() + timedelta(days=1)
+
+        return min(next_day, datetime.utcnow().date()).isoformat()
+
     def _start_days_till_now(self, start_date: str) -> Generator:
-        """Yield YYYY/MM/DD for every day until now.
+        """Yield YYYY/MM/DD for every day until now or the end_date.
 
         Arguments:
             start_date {str} -- Start date e.g. 2020-01-01
 
         Yields:
-            Generator -- Every day until now.
+            Generator -- Every day until now or the end_date.
         """
         # Parse input date
         year: int = int(start_date.split('-')[0])
@@ -145,12 +1124,216 @@ class Basecone(object):  # noqa: WPS230
         # Setup start period
         period: date = date(year, month, day)
 
+        # Setup end period
+        until: datetime = datetime.utcnow()
+        if self.end_date:
+            until = min(until, datetime.strptime(self.end_date, '%Y-%m-%d'))
+
         # Setup itterator
         dates: rrule = rrule(
             freq=DAILY,
             dtstart=period,
-            until=datetime.utcnow(),
+            until=until,
         )
 
         # Yield dates in YYYY-MM-DD format
-        yield from (date_day.strftime('%Y-%m-%d') for date_day in dates)
\ No newline at end of file
+        yield from (date_day.strftime('%Y-%m-%d') for date_day in dates)
+
+
+class AsyncBasecone(Basecone):
+    """Asynchronous Basecone API Client.
+
+    The methods have the same semantics as the Basecone client, but are async
+    generators. Multiple companies or date ranges can be retrieved
+    concurrently in one event loop, e.g.:
+
+    async for row in AsyncBasecone(company_id, token).transaction_collection(
+        start_date='2021-01-01',
+    ):
+        ...
+
+    The days are requested one by one, concurrency comes from the event
+    loop, so the max_concurrency and memory options are not supported.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize asynchronous Basecone client.
+
+        Takes the arguments of the Basecone client.
+
+        Arguments:
+            args {Any} -- Arguments of the Basecone client
+            kwargs {Any} -- Keyword arguments of the Basecone client
+
+        Raises:
+            ValueError: The max_concurrency or memory option is set
+        """
+        if (kwargs.get('max_concurrency') or 1) > 1 or kwargs.get('memory'):
+            raise ValueError(
+                'The AsyncBasecone client does not support the '
+                'max_concurrency and memory options.',
+            )
+
+        super().__init__(*args, **kwargs)
+
+        # Hedged requests are tasks in the event loop instead of threads
+        self.executor = None
+
+    async def transaction_collection(  # noqa: WPS210
+        self,
+        **kwargs: dict,
+    ) -> AsyncGenerator[dict, None]:
+        """Basecone transactions.
+
+        Arguments:
+            start_date {str} -- String which contains the date
+
+        Yields:
+            AsyncGenerator[dict] -- Yields Basecone transactions
+        """
+        self.logger.info('Stream Basecone transactions')
+
+        cleaner: Callable = self.cleaners.get('transaction_collection', {})
+
+        for date_day, checkpoint in self._transaction_days(**kwargs):
+            # Stop at the day boundary when the budget of the run is spent
+            if self.budget_exhausted():
+                self._stop(date_day)
+                self._day_aborted(date_day)
+                break
+
+            self.logger.info(
+                f'Recieving Basecone transactions from {date_day}'
+            )
+
+            try:
+                response: httpx.Response = await self._fetch_day(date_day)
+            except Exception:
+                self._day_aborted(date_day)
+                raise
+
+            if response.status_code == 404:  # noqa: WPS432
+                self.logger.info(
+                    f'Transactions with date: {date_day} not '
+                    'found, stopping.',
+                )
+                self._day_aborted(date_day)
+                break
+            elif response.status_code != 200:
+                self._raise_for_day(date_day, response)
+
+            for row in self._clean_rows(
+                'transaction_collection',
+                date_day,
+                cleaner,
+                self._decode_transactions(response),
+            ):
+                yield row
+
+            # The day is completely retrieved
+            self._day_completed('transaction_collection', date_day, checkpoint)
+
+    async def _fetch_day(self, date_day: str) -> httpx.Response:
+        """Request a day, again after a backoff when it is rate limited.
+
+        Days which are rate limited or failed on the server are requested
+        again, the response of the last attempt is returned.
+
+        Arguments:
+            date_day {str} -- Day in YYYY-MM-DD format
+
+        Returns:
+            httpx.Response -- Response
+        """
+        attempt: int = 1
+        while True:
+            response: httpx.Response = await self._get(
+                self._transaction_url(date_day),
+            )
+
+            if attempt >= FETCH_ATTEMPTS or (
+                response.status_code != 429  # noqa: WPS432
+                and response.status_code < 500  # noqa: WPS432
+            ):
+                return response
+
+            delay: float = retry_delay(response, attempt)
+            self.logger.info(
+                f'Requesting {date_day} again in {delay:.1f} '
+                f'seconds after status {response.status_code}',
+            )
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _get(self, url: str) -> httpx.Response:  # noqa: WPS210
+        """Send a GET request, hedged when it takes unusually long.
+
+        The slower of a hedged pair of requests is cancelled.
+
+        Arguments:
+            url {str} -- URL
+
+        Returns:
+            httpx.Response -- Response
+        """
+        delay: Optional[float] = self._hedge_delay()
+        if delay is None:
+            return await self._timed_get(url)
+
+        primary: asyncio.Task = asyncio.ensure_future(self._timed_get(url))
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done or not self._may_hedge():
+            return await primary
+
+        self.hedges += 1
+        self.logger.info(f'Hedging request after {delay:.2f} seconds: {url}')
+
+        hedge: asyncio.Task = asyncio.ensure_future(self._timed_get(url))
+        done, pending = await asyncio.wait(
+            [primary, hedge],
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+        # Use the other request when the first one failed
+        winner: asyncio.Task = done.pop()
+        if winner.exception() is not None and pending:
+            winner = pending.pop()
+            return await winner
+
+        for task in pending:
+            task.cancel()
+        return winner.result()
+
+    async def _timed_get(self, url: str) -> httpx.Response:
+        """Send a GET request and save its response time.
+
+        Arguments:
+            url {str} -- URL
+
+        Returns:
+            httpx.Response -- Response
+        """
+        if self.rate_limiter:
+            await asyncio.sleep(self.rate_limiter.reserve())
+
+        self.requests += 1
+        started: float = time.monotonic()
+        response: httpx.Response = await self.client.get(
+            url,
+            headers=self.headers,
+        )
+        self.latencies.append(time.monotonic() - started)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the web client."""
+        await self.client.aclose()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the reusable asynchronous web client.
+
+        Returns:
+            httpx.AsyncClient -- Web client
+        """
+        return httpx.AsyncClient(http2=True)
@@ -0,0 +1,238 @@
+"""Singer BATCH messages."""
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import IO, Any, Optional
+from urllib.parse import ParseResult, unquote, urlparse
+
+import singer
+from singer.messages import Message
+
+try:
+    import zstandard  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    zstandard = None  # noqa: WPS440
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Default upper bound of the uncompressed size of a batch file: 100 MiB
+MAX_BYTES: int = 104857600
+EXTENSIONS: MappingProxyType = MappingProxyType({
+    'gzip': 'jsonl.gz',
+    'zstd': 'jsonl.zst',
+})
+
+
+def storage_path(root: str) -> str:
+    """Convert the storage root to a local directory.
+
+    The root is a file URI or a plain path. Relative file URIs, such as
+    file://./batches or file://batches, are relative to the current
+    directory.
+
+    Arguments:
+        root {str} -- File URI or path
+
+    Raises:
+        ValueError: Unsupported URI scheme
+
+    Returns:
+        str -- Directory
+    """
+    parsed: ParseResult = urlparse(root)
+    if not parsed.scheme:
+        return root
+    elif parsed.scheme != 'file':
+        raise ValueError(f'Unsupported batch storage: {root}')
+
+    # The host part of a relative URI is the first part of the path
+    netloc: str = '' if parsed.netloc == 'localhost' else parsed.netloc
+    return unquote(f'{netloc}{parsed.path}') or '.'
+
+
+class BatchMessage(Message):
+    """BATCH message.
+
+    The BATCH message points the target to one or more files which contain
+    the records of a stream, e.g.:
+    {"type": "BATCH", "stream": "users",
+     "encoding": {"format": "jsonl", "compression": "gzip"},
+     "manifest": ["file:///tmp/users-0001.jsonl.gz"]}
+    """
+
+    def __init__(self, stream: str, encoding: dict, manifest: list) -> None:
+        """Initialize BATCH message.
+
+        Arguments:
+            stream {str} -- Stream name
+            encoding {dict} -- File format and compression
+            manifest {list} -- URIs of the files
+        """
+        self.stream: str = stream
+        self.encoding: dict = encoding
+        self.manifest: list = manifest
+
+    def asdict(self) -> dict:
+        """Return the message as dictionary.
+
+        Returns:
+            dict -- Message
+        """
+        return {
+            'type': 'BATCH',
+            'stream': self.stream,
+            'encoding': self.encoding,
+            'manifest': self.manifest,
+        }
+
+
+def write_batch(stream_name: str, encoding: dict, manifest: list) -> None:
+    """Write a BATCH message.
+
+    Arguments:
+        stream_name {str} -- Stream name
+        encoding {dict} -- File format and compression
+        manifest {list} -- URIs of the files
+    """
+    singer.write_message(BatchMessage(stream_name, encoding, manifest))
+
+
+class BatchWriter(object):  # noqa: WPS230
+    """Write records into size-bounded compressed JSONL files."""
+
+    def __init__(self, stream_name: str, batch_config: dict) -> None:
+        """Initialize batch writer.
+
+        The batch_config follows the Singer SDK layout, e.g.:
+        {"encoding": {"format": "jsonl", "compression": "gzip"},
+         "storage": {"root": "file:///tmp/batches", "prefix": "basecone-"},
+         "max_bytes": 104857600}
+
+        Arguments:
+            stream_name {str} -- Stream name
+            batch_config {dict} -- Batch configuration
+
+        Raises:
+            ValueError: Unsupported format, compression or storage
+        """
+        self.stream_name: str = stream_name
+
+        encoding: dict = batch_config.get('encoding', {})
+        self.encoding: dict = {
+            'format': encoding.get('format', 'jsonl'),
+            'compression': encoding.get('compression', 'gzip'),
+        }
+        if self.encoding['format'] != 'jsonl':
+            raise ValueError(
+                f'Unsupported batch format: {self.encoding["format"]}',
+            )
+        if self.encoding['compression'] not in EXTENSIONS:
+            raise ValueError(
+                'Unsupported batch compression: '
+                f'{self.encoding["compression"]}',
+            )
+        if self.encoding['compression'] == 'zstd' and zstandard is None:
+            raise ValueError(
+                'The zstd compression requires the zstandard package.',
+            )
+
+        storage: dict = batch_config.get('storage', {})
+        self.root: str = storage_path(storage.get('root', '.'))
+        self.prefix: str = storage.get('prefix', '')
+        self.max_bytes: int = int(batch_config.get('max_bytes', MAX_BYTES))
+
+        os.makedirs(self.root, exist_ok=True)
+
+        # The currently open file
+        self.path: Optional[str] = None
+        self.raw_file: Optional[IO[bytes]] = None
+        self.file: Optional[Any] = None
+        self.size: int = 0
+        self.count: int = 0
+
+    def full(self) -> bool:
+        """Whether the current file reached its maximum size.
+
+        Returns:
+            bool -- The file is full
+        """
+        return self.file is not None and self.size >= self.max_bytes
+
+    def write_record(self, row: dict) -> None:
+        """Write a record to the current file.
+
+        Arguments:
+            row {dict} -- Record
+        """
+        if self.file is None:
+            self._open()
+
+        line: bytes = (json.dumps(row) + '\n').encode('utf-8')
+        self.file.write(line)
+        self.size += len(line)
+
+    def flush(self) -> bool:
+        """Durably write the current file and emit its BATCH message.
+
+        Returns:
+            bool -- Whether a file was written
+        """
+        if self.file is None:
+            return False
+
+        # Close the compressor, then sync the file to disk before the file
+        # is made visible under its final name
+        self.file.close()
+        self.raw_file.flush()
+        os.fsync(self.raw_file.fileno())
+        self.raw_file.close()
+
+        final_path: str = self.path[:-len('.part')]
+        os.replace(self.path, final_path)
+
+        # Sync the directory, so the rename is durable as well
+        directory: int = os.open(os.path.dirname(final_path), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+        write_batch(
+            self.stream_name,
+            dict(self.encoding),
+            [f'file://{final_path}'],
+        )
+
+        self.path = None
+        self.raw_file = None
+        self.file = None
+        self.size = 0
+        return True
+
+    def _open(self) -> None:
+        """Open a new batch file."""
+        self.count += 1
+        timestamp: str = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+        extension: str = EXTENSIONS[self.encoding['compression']]
+        filename: str = (
+            f'{self.prefix}{self.stream_name}-{timestamp}-'
+            f'{self.count:04d}.{extension}'
+        )
+        self.path = os.path.abspath(
+            os.path.join(self.root, f'{filename}.part'),
+        )
+
+        self.raw_file = open(self.path, 'wb')  # noqa: WPS515
+        if self.encoding['compression'] == 'zstd':
+            self.file = zstandard.ZstdCompressor().stream_writer(
+                self.raw_file,
+                closefd=False,
+            )
+        else:
+            self.file = gzip.GzipFile(fileobj=self.raw_file, mode='wb')
+
+        LOGGER.info(f'Writing batch file: {self.path}')
@@ -1,9 +1,55 @@
 """Basecone cleaners."""
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache, partial, reduce
+from operator import attrgetter, itemgetter
 from types import MappingProxyType
 from tap_basecone.streams import STREAMS
-from typing import Any, Optional
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Tuple
+
+
+# Paths of the fields in a Basecone transaction
+TRANSACTION_COLLECTION_FIELDS: MappingProxyType = MappingProxyType({
+    'type': ('type',),
+    'description': ('description',),
+    'dueDate': ('dueDate',),
+    'invoiceNumber': ('invoiceNumber',),
+    'purchaseOrderNumber': ('purchaseOrderNumber',),
+    'supplier_id': ('supplier', 'supplierId'),
+    'supplier_code': ('supplier', 'code'),
+    'supplier_name': ('supplier', 'name'),
+    'paymentCondition': ('paymentCondition',),
+    'isInPaymentBatch': ('isInPaymentBatch',),
+    'isCreditNote': ('isCreditNote',),
+    'totalAmount': ('totalAmount',),
+    'transactionID': ('transactionId',),
+    'documentID': ('documentId',),
+    'targetCompany': ('targetCompany', 'code'),
+    'destinationCompany': ('destinationCompany', 'code'),
+    'transactionNumber': ('transactionNumber',),
+    'transactionDate': ('transactionDate',),
+    'generalledger_id': ('generalLedger', 'generalLedgerId'),
+    'generalledger_code': ('generalLedger', 'code'),
+    'period': ('period',),
+    'currency_id': ('currency', 'currencyId'),
+    'currency_code': ('currency', 'code'),
+    'additionalField1': ('additionalField1',),
+    'additionalField2': ('additionalField2',),
+    'additionalField3': ('additionalField3',),
+    'isFinalBooking': ('isFinalBooking',),
+    'bookYear': ('bookYear',),
+})
+
+# Compiled field of a cleaner: column, accessor in dictionaries, accessor in
+# structs, data type, nullable and whether it is converted to a string
+Field = Tuple[str, Callable, Callable, Optional[Any], bool, bool]
+
+# Boolean fields which are converted to a string
+STRING_FIELDS: frozenset = frozenset((
+    'isInPaymentBatch',
+    'isCreditNote',
+    'isFinalBooking',
+))
 
 
 class ConvertionError(ValueError):
@@ -38,7 +84,7 @@ def to_type_or_null(
         # Convert the input value to the data_type
         try:
             return data_type(input_value)
-        except ValueError as err:
+        except (ValueError, TypeError, OverflowError) as err:
             raise ConvertionError(
                 f'Could not convert {input_value} to {data_type}: {err}',
             )
@@ -53,90 +99,183 @@ def to_type_or_null(
     return input_value
 
 
-def clean_row(row: dict, mapping: dict) -> dict:
-    """Clean the row according to the mapping.
-
-    The mapping is a dictionary with optional keys:
-    - map: The name of the new key/column
-    - type: A data type or function to apply to the value of the key
-    - nullable: Whether to convert empty values, such as '', {} or [] to None
+def compose(outer: Callable, inner: Callable) -> Callable:
+    """Compose two accessors.
 
     Arguments:
-        row {dict} -- Input row
-        mapping {dict} -- Input mapping
+        outer {Callable} -- Accessor of the outer value
+        inner {Callable} -- Accessor of the value in the outer value
 
     Returns:
-        dict -- Cleaned row
+        Callable -- Accessor of the inner value
     """
-    cleaned: dict = {}
+    return lambda input_data: inner(outer(input_data))  # noqa: WPS442
 
-    key: str
-    key_mapping: dict
 
-    # For every key and value in the mapping
-    for key, key_mapping in mapping.items():
+def compile_fields(mapping: dict) -> Tuple[Field, ...]:
+    """Compile the mapping of transaction fields into accessors.
 
-        # Retrieve the new mapping or use the original
-        new_mapping: str = key_mapping.get('map') or key
+    Every field gets an accessor of its path in dictionaries and one in
+    decoded structs, which are built once instead of walking the path for
+    every row. The mapping of every field is a dictionary with optional keys:
+    - map: The name of the new key/column
+    - type: A data type or function to apply to the value of the key
+    - null: Whether to convert empty values, such as '', {} or [] to None
 
-        # Convert the value
-        cleaned[new_mapping] = to_type_or_null(
-            row[key],
+    Arguments:
+        mapping {dict} -- Mapping of the fields
+
+    Returns:
+        Tuple[Field, ...] -- Compiled fields
+    """
+    paths: MappingProxyType = TRANSACTION_COLLECTION_FIELDS
+
+    return tuple(
+        (
+            key_mapping.get('map') or key,
+            reduce(compose, map(itemgetter, paths[key])),
+            attrgetter('.'.join(paths[key])),
             key_mapping.get('type'),
             key_mapping.get('null', True),
+            key in STRING_FIELDS,
         )
-
-    return cleaned
+        for key, key_mapping in mapping.items()
+    )
 
 
 def clean_transaction_collection(
-    input_data: dict,
+    input_data: Any,
+    fields: Optional[Tuple[Field, ...]] = None,
 ) -> dict:
     """Clean transaction collection input_data.
 
+    The fields are extracted from the nested input_data and converted in one
+    step. Missing values, e.g. of a transaction without supplier, are None.
+
     Arguments:
-        input_data {dict} -- input input_data
+        input_data {Any} -- input input_data, a dictionary or decoded struct
+
+    Keyword Arguments:
+        fields {Optional[Tuple[Field, ...]]} -- Compiled fields to clean,
+            defaults to all fields (default: {None})
 
     Returns:
         dict -- cleaned input_data
     """
-    # Get the mapping from the STREAMS
-    mapping: Optional[dict] = STREAMS['transaction_collection'].get(
-        'mapping',
+    if fields is None:
+        fields = TRANSACTION_COLLECTION_CLEANER_FIELDS
+
+    structs: bool = not isinstance(input_data, dict)
+    cleaned: dict = {}
+
+    for (
+        column,
+        item_accessor,
+        attribute_accessor,
+        data_type,
+        nullable,
+        to_string,
+    ) in fields:
+        try:
+            input_value: Any = (
+                attribute_accessor(input_data)
+                if structs else item_accessor(input_data)
+            )
+        except (AttributeError, KeyError, TypeError):
+            input_value = None
+
+        if to_string:
+            input_value = str(input_value)
+
+        # Convert the value
+        cleaned[column] = to_type_or_null(input_value, data_type, nullable)
+
+    return cleaned
+
+
+@lru_cache(maxsize=None)
+def build_cleaner(
+    stream_name: str,
+    properties: Optional[FrozenSet[str]] = None,
+) -> Callable:
+    """Build a cleaner which only cleans the selected properties.
+
+    Fields which are not selected are not extracted nor converted. The
+    cleaners are cached, so runs of a long-lived process reuse them.
+
+    Arguments:
+        stream_name {str} -- Stream name
+
+    Keyword Arguments:
+        properties {Optional[FrozenSet[str]]} -- Selected properties, all
+            properties if None (default: {None})
+
+    Returns:
+        Callable -- Cleaner
+    """
+    cleaner: Callable = CLEANERS[stream_name]
+    mapping: dict = STREAMS[stream_name]['mapping']
+
+    if properties is None:
+        return cleaner
+
+    return partial(
+        cleaner,
+        fields=compile_fields({
+            key: key_mapping
+            for key, key_mapping in mapping.items()
+            if (key_mapping.get('map') or key) in properties
+        }),
     )
 
-    cleaned_data = {
-        'type': input_data.get('type'),
-        'description': input_data.get('description'),
-        'dueDate': input_data.get('dueDate'),
-        'invoiceNumber': input_data.get('invoiceNumber'),
-        'purchaseOrderNumber': input_data.get('purchaseOrderNumber'),
-        'supplier_id': input_data.get('supplier', {}).get('supplierId'),
-        'supplier_code': input_data.get('supplier', {}).get('code'),
-        'supplier_name': input_data.get('supplier', {}).get('name'),
-        'paymentCondition': input_data.get('paymentCondition'),
-        'isInPaymentBatch': str(input_data.get('isInPaymentBatch')),
-        'isCreditNote': str(input_data.get('isCreditNote')),
-        'totalAmount': input_data.get('totalAmount'),
-        'transactionID': input_data.get('transactionId'),
-        'documentID': input_data.get('documentId'),
-        'targetCompany': input_data.get('targetCompany', {}).get('code'),
-        'destinationCompany': input_data.get('destinationCompany', {}).get('code'),
-        'transactionNumber': input_data.get('transactionNumber'),
-        'transactionDate': input_data.get('transactionDate'),
-        'generalledger_id': input_data.get('generalLedger', {}).get('generalLedgerId'),
-        'generalledger_code': input_data.get('generalLedger', {}).get('code'),
-        'period': input_data.get('period'),
-        'currency_id': input_data.get('currency', {}).get('currencyId'),
-        'currency_code': input_data.get('currency', {}).get('code'),
-        'additionalField1': input_data.get('additionalField1'),
-        'additionalField2': input_data.get('additionalField2'),
-        'additionalField3': input_data.get('additionalField3'),
-        'isFinalBooking': str(input_data.get('isFinalBooking')),
-        'bookYear': input_data.get('bookYear'),
-    }
-    return clean_row(cleaned_data, mapping)
 
+def split_dimensions(
+    row: dict,
+    dimensions: Iterable[str],
+) -> Tuple[dict, List[Tuple[str, dict]]]:
+    """Split the dimension columns from a cleaned row.
+
+    Every dimension stream in STREAMS has one or more references, which map
+    columns of the parent row to columns of the dimension. The key column of
+    the dimension is kept in the row as foreign key, all other referenced
+    columns are moved to the dimension row. References without a key value
+    do not produce a dimension row.
+
+    Arguments:
+        row {dict} -- Cleaned row
+        dimensions {Iterable[str]} -- Names of the dimension streams
+
+    Returns:
+        Tuple[dict, List[Tuple[str, dict]]] -- The row with foreign keys and
+            a list of (stream name, dimension row)
+    """
+    fact: dict = dict(row)
+    dimension_rows: List[Tuple[str, dict]] = []
+
+    for stream_name in dimensions:
+        stream_meta: dict = STREAMS[stream_name]
+        key: str = stream_meta['key_properties']
+
+        for reference in stream_meta['references']:
+            dimension_row: dict = {}
+
+            # Keep the foreign key in the row, move the other columns
+            for column, dimension_column in reference.items():
+                if dimension_column == key:
+                    dimension_row[dimension_column] = fact.get(column)
+                else:
+                    dimension_row[dimension_column] = fact.pop(column, None)
+
+            if dimension_row.get(key) is not None:
+                dimension_rows.append((stream_name, dimension_row))
+
+    return fact, dimension_rows
+
+
+# Compiled fields of all transaction fields
+TRANSACTION_COLLECTION_CLEANER_FIELDS: Tuple[Field, ...] = compile_fields(
+    STREAMS['transaction_collection']['mapping'],
+)
 
 # Collect all cleaners
 CLEANERS: MappingProxyType = MappingProxyType({
@@ -0,0 +1,149 @@
+"""Long-running daemon mode."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import signal
+import threading
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Optional
+
+import singer
+from singer.catalog import Catalog
+
+from tap_basecone.basecone import Basecone
+from tap_basecone.sync import sync
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Default interval between runs: 5 minutes
+DAEMON_INTERVAL: float = 300
+
+
+class Daemon(object):
+    """Run incremental syncs with a warm Basecone client.
+
+    The client, its web connection, the catalog and the cleaners are kept
+    alive between runs. Every run writes its Singer messages to its own file
+    in the output directory, the state after the run is written to
+    state.json. A run is started every interval, or immediately on SIGUSR1.
+    SIGTERM and SIGINT stop the daemon after the current run.
+    """
+
+    def __init__(
+        self,
+        basecone: Basecone,
+        state: dict,
+        catalog: Catalog,
+        config: dict,
+    ) -> None:
+        """Initialize daemon.
+
+        Arguments:
+            basecone {Basecone} -- Basecone client
+            state {dict} -- Tap state, unless a state file exists
+            catalog {Catalog} -- Stream catalog
+            config {dict} -- Tap configuration
+        """
+        self.basecone: Basecone = basecone
+        self.catalog: Catalog = catalog
+        self.config: dict = config
+
+        self.interval: float = float(
+            config.get('daemon_interval', DAEMON_INTERVAL),
+        )
+        self.output_dir: str = config['daemon_output_dir']
+        self.state_path: str = os.path.join(self.output_dir, 'state.json')
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Continue from the state of the previous daemon
+        self.state: dict = state or {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as state_file:
+                self.state = json.load(state_file)
+
+        self.wakeup: threading.Event = threading.Event()
+        self.stopping: bool = False
+
+    def run(self) -> None:
+        """Run syncs until the daemon is stopped."""
+        signal.signal(signal.SIGUSR1, self._trigger)
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        LOGGER.info(
+            f'Running daemon every {self.interval} seconds, '
+            f'output in {self.output_dir}',
+        )
+
+        while not self.stopping:
+            self.run_once()
+
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+
+        LOGGER.info('Daemon stopped')
+
+    def run_once(self) -> str:
+        """Run one sync and save its output and state.
+
+        Returns:
+            str -- Path of the output of the run
+        """
+        run_id: str = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+        output_path: str = os.path.join(self.output_dir, f'{run_id}.jsonl')
+
+        LOGGER.info(f'Starting run {run_id}')
+        self.basecone.start_run()
+
+        try:
+            with open(output_path, 'w') as output_file:
+                with redirect_stdout(output_file):
+                    sync(
+                        self.basecone,
+                        self.state,
+                        self.catalog,
+                        self.config.get('start_date'),
+                        self.config,
+                    )
+        except Exception as err:
+            # The state contains the checkpoints up to the failure
+            LOGGER.exception(f'Run {run_id} failed: {err}')
+
+        # Rows of the next run are appended to the dead-letter file again
+        if self.basecone.dead_letter:
+            self.basecone.dead_letter.close()
+
+        self._write_state()
+        return output_path
+
+    def _write_state(self) -> None:
+        """Atomically write the state file."""
+        temporary_path: str = f'{self.state_path}.part'
+        with open(temporary_path, 'w') as state_file:
+            json.dump(self.state, state_file, indent=2)
+        os.replace(temporary_path, self.state_path)
+
+    def _trigger(self, signum: int, frame: Optional[FrameType]) -> None:
+        """Start a run immediately.
+
+        Arguments:
+            signum {int} -- Signal number
+            frame {Optional[FrameType]} -- Current stack frame
+        """
+        LOGGER.info('Run requested')
+        self.wakeup.set()
+
+    def _stop(self, signum: int, frame: Optional[FrameType]) -> None:
+        """Stop the daemon after the current run.
+
+        Arguments:
+            signum {int} -- Signal number
+            frame {Optional[FrameType]} -- Current stack frame
+        """
+        LOGGER.info('Stopping daemon after the current run')
+        self.stopping = True
+        self.wakeup.set()
@@ -0,0 +1,331 @@
+"""Export data to Parquet files."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import singer
+from singer.catalog import Catalog, CatalogEntry
+
+from tap_basecone import tools
+from tap_basecone.basecone import Basecone
+from tap_basecone.cleaners import build_cleaner
+
+try:
+    import pyarrow  # noqa: WPS433
+    from pyarrow import parquet  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    pyarrow = None  # noqa: WPS440
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Default number of rows per row group
+ROW_GROUP_SIZE: int = 50000
+PARTITION_BY: tuple = ('book_year', 'period')
+EXPORT_STREAMS: frozenset = frozenset(('transaction_collection',))
+
+
+def arrow_type(json_schema: dict) -> Any:
+    """Convert a JSON schema property to an Arrow data type.
+
+    Arguments:
+        json_schema {dict} -- JSON schema of the property
+
+    Returns:
+        pyarrow.DataType -- Arrow data type
+    """
+    json_types: Any = json_schema.get('type', [])
+    if isinstance(json_types, str):
+        json_types = [json_types]
+
+    if 'object' in json_types:
+        return pyarrow.struct([
+            pyarrow.field(name, arrow_type(prop))
+            for name, prop in json_schema.get('properties', {}).items()
+        ])
+    elif json_schema.get('format') == 'integer' or 'integer' in json_types:
+        return pyarrow.int64()
+    elif 'number' in json_types:
+        return pyarrow.float64()
+    elif 'boolean' in json_types:
+        return pyarrow.bool_()
+    elif json_schema.get('format') == 'date-time':
+        return pyarrow.timestamp('us')
+    return pyarrow.string()
+
+
+def to_timestamp(input_value: Optional[str]) -> Optional[datetime]:
+    """Convert an isoformat date to a naive UTC datetime.
+
+    Arguments:
+        input_value {Optional[str]} -- Date in isoformat
+
+    Returns:
+        Optional[datetime] -- Naive datetime in UTC
+    """
+    if not input_value:
+        return None
+
+    parsed_date: datetime = datetime.fromisoformat(input_value)
+    if parsed_date.tzinfo is not None:
+        parsed_date = parsed_date.astimezone(timezone.utc).replace(
+            tzinfo=None,
+        )
+    return parsed_date
+
+
+class ParquetExporter(object):  # noqa: WPS230
+    """Write records into partitioned Parquet files."""
+
+    def __init__(
+        self,
+        path: str,
+        stream_name: str,
+        schema: dict,
+        row_group_size: int = ROW_GROUP_SIZE,
+        measure: bool = False,
+    ) -> None:
+        """Initialize Parquet exporter.
+
+        The files are written in hive style partitions, e.g.:
+        path/stream/book_year=2021/period=3/part-20210101T000000.parquet
+
+        A file is written under a hidden temporary name and only renamed
+        once it is complete. The rows buffered over all partitions are
+        bounded by the row_group_size.
+
+        Arguments:
+            path {str} -- Root directory of the export
+            stream_name {str} -- Stream name
+            schema {dict} -- JSON schema of the stream
+
+        Keyword Arguments:
+            row_group_size {int} -- Rows per row group (default: ROW_GROUP_SIZE)
+            measure {bool} -- Whether to approximate the size of the buffers,
+                e.g. for a memory governor (default: {False})
+        """
+        self.path: str = os.path.join(path, stream_name)
+        self.row_group_size: int = row_group_size
+        self.timestamp: str = datetime.now(timezone.utc).strftime(
+            '%Y%m%dT%H%M%S',
+        )
+
+        # The partition columns are stored in the directory names
+        self.schema: Any = pyarrow.schema([
+            pyarrow.field(name, arrow_type(prop))
+            for name, prop in schema['properties'].items()
+            if name not in PARTITION_BY
+        ])
+
+        # Columns which have to be converted before writing
+        self.converters: Dict[str, Callable] = {
+            field.name: to_timestamp
+            for field in self.schema
+            if pyarrow.types.is_timestamp(field.type)
+        }
+
+        # Column buffers, writers and file paths per partition
+        self.buffers: Dict[Tuple, Dict[str, List]] = {}
+        self.writers: Dict[Tuple, Any] = {}
+        self.paths: Dict[Tuple, str] = {}
+        self.count: int = 0
+        self.buffered: int = 0
+
+        # Approximate size of the buffered values per partition
+        self.measure: bool = measure
+        self.sizes: Dict[Tuple, int] = {}
+
+    def write_record(self, row: dict) -> None:
+        """Add a record to the buffer of its partition.
+
+        Arguments:
+            row {dict} -- Record
+        """
+        partition: Tuple = tuple(row.get(column) for column in PARTITION_BY)
+
+        buffer: Optional[Dict[str, List]] = self.buffers.get(partition)
+        if buffer is None:
+            buffer = {name: [] for name in self.schema.names}
+            self.buffers[partition] = buffer
+
+        for name, column in buffer.items():
+            converter: Optional[Callable] = self.converters.get(name)
+            column_value: Any = row.get(name)
+            if converter:
+                column_value = converter(column_value)
+            column.append(column_value)
+
+        if self.measure:
+            self.sizes[partition] = self.sizes.get(partition, 0) + sum(
+                sys.getsizeof(column[-1]) for column in buffer.values()
+            )
+
+        self.count += 1
+        self.buffered += 1
+
+        # Write all buffers when the buffered rows of all partitions reach
+        # the size of a row group
+        if self.buffered >= self.row_group_size:
+            self.flush()
+
+    @property
+    def size(self) -> int:
+        """Approximate size of the buffers.
+
+        Returns:
+            int -- Buffered bytes
+        """
+        return sum(self.sizes.values())
+
+    def flush(self) -> None:
+        """Write the buffers of all partitions as row groups."""
+        for partition in list(self.buffers):
+            self._write_row_group(partition)
+        self.buffered = 0
+
+    def close(self) -> None:
+        """Write the remaining buffers, close and rename all files."""
+        self.flush()
+
+        for partition, writer in self.writers.items():
+            writer.close()
+
+            # Rename to the final name, without the leading dot and the
+            # .tmp suffix
+            temporary_path: str = self.paths[partition]
+            directory, filename = os.path.split(temporary_path)
+            os.replace(
+                temporary_path,
+                os.path.join(directory, filename[1:-len('.tmp')]),
+            )
+
+        self.writers = {}
+        self.paths = {}
+        LOGGER.info(f'Exported {self.count} records to {self.path}')
+
+    def _write_row_group(self, partition: Tuple) -> None:
+        """Write the buffer of a partition as row group.
+
+        Arguments:
+            partition {Tuple} -- Partition values
+        """
+        buffer: Dict[str, List] = self.buffers.pop(partition)
+        self.sizes.pop(partition, None)
+        if not buffer[self.schema.names[0]]:
+            return
+
+        writer: Any = self.writers.get(partition)
+        if writer is None:
+            directory: str = os.path.join(
+                self.path,
+                *(
+                    f'{column}={partition_value}'
+                    for column, partition_value in zip(PARTITION_BY, partition)
+                ),
+            )
+            os.makedirs(directory, exist_ok=True)
+
+            # Hidden files are skipped by readers of the dataset
+            self.paths[partition] = os.path.join(
+                directory,
+                f'.part-{self.timestamp}.parquet.tmp',
+            )
+            writer = parquet.ParquetWriter(
+                self.paths[partition],
+                self.schema,
+            )
+            self.writers[partition] = writer
+
+        writer.write_table(
+            pyarrow.Table.from_pydict(buffer, schema=self.schema),
+        )
+
+
+def export(
+    basecone: Basecone,
+    state: dict,
+    catalog: Catalog,
+    config: dict,
+) -> None:
+    """Export data from tap source to Parquet files.
+
+    No Singer messages are written. The state after the export is written to
+    the file state.json in the export directory.
+
+    Arguments:
+        basecone {Basecone} -- Basecone client
+        state {dict} -- Tap state
+        catalog {Catalog} -- Stream catalog
+        config {dict} -- Tap configuration
+
+    Raises:
+        ValueError: pyarrow is not installed
+    """
+    if pyarrow is None:
+        raise ValueError('The export mode requires the pyarrow package.')
+
+    export_path: str = config['export_path']
+    row_group_size: int = int(config.get('row_group_size', ROW_GROUP_SIZE))
+
+    LOGGER.info(f'Export to: {export_path}')
+    os.makedirs(export_path, exist_ok=True)
+
+    stream: CatalogEntry
+    for stream in catalog.get_selected_streams(state):
+        if stream.tap_stream_id not in EXPORT_STREAMS:
+            continue
+
+        LOGGER.info(f'Exporting stream: {stream.tap_stream_id}')
+
+        stream_state: dict = tools.get_stream_state(
+            state,
+            stream.tap_stream_id,
+        ) or {'start_date': (config.get('start_date') or '')[:10]}
+
+        # Only the selected properties are cleaned, the partition columns
+        # are always required to write the rows
+        basecone.cleaners[stream.tap_stream_id] = build_cleaner(
+            stream.tap_stream_id,
+            frozenset(tools.get_selected_properties(stream)).union(
+                PARTITION_BY,
+            ),
+        )
+
+        exporter: ParquetExporter = ParquetExporter(
+            export_path,
+            stream.tap_stream_id,
+            stream.schema.to_dict(),
+            row_group_size,
+            measure=basecone.memory is not None,
+        )
+
+        # Under memory pressure the buffers are written as row groups
+        if basecone.memory:
+            basecone.memory.register(
+                stream.tap_stream_id,
+                lambda: exporter.size,  # noqa: WPS430
+                exporter.flush,
+            )
+
+        for row in getattr(basecone, stream.tap_stream_id)(**stream_state):
+            exporter.write_record(row)
+
+        exporter.close()
+
+        if basecone.memory:
+            basecone.memory.unregister(stream.tap_stream_id)
+
+        # Save the state after the last retrieved day
+        checkpoint: Optional[dict] = basecone.commit(stream.tap_stream_id)
+        if checkpoint:
+            state.setdefault('bookmarks', {})[stream.tap_stream_id] = (
+                checkpoint
+            )
+
+    LOGGER.info(f'Run summary: {basecone.summary()}')
+
+    with open(os.path.join(export_path, 'state.json'), 'w') as state_file:
+        json.dump(state, state_file, indent=2)
@@ -0,0 +1,182 @@
+"""Memory governor which keeps the tap below a memory ceiling."""
+# -*- coding: utf-8 -*-
+import logging
+import os
+import resource
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+import singer
+
+try:
+    import psutil  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    psutil = None  # noqa: WPS440
+
+# The current process, reused for every measurement
+PROCESS: Any = psutil.Process() if psutil is not None else None
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Part of the ceiling after which the memory is relieved
+HIGH_WATER: float = 0.8
+
+# Part of the ceiling which may be held in registered buffers
+BUFFER_SHARE: float = 0.25
+
+# Minimum interval between flushes while only the RSS is high
+FLUSH_INTERVAL: float = 1
+
+
+def current_rss() -> int:
+    """Resident set size of this process.
+
+    Uses psutil when installed, otherwise /proc/self/statm. On platforms
+    without either, the peak resident set size is used.
+
+    Returns:
+        int -- Resident set size in bytes
+    """
+    if psutil is not None:
+        return PROCESS.memory_info().rss
+
+    try:
+        with open('/proc/self/statm') as statm:
+            resident_pages: int = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        # Kilobytes on Linux, bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+class MemoryGovernor(object):  # noqa: WPS230
+    """Apply backpressure before the tap reaches its memory ceiling.
+
+    Writers register their buffers with a size and a flush function. When
+    the buffers grow past their share of the ceiling, the buffers are
+    flushed, largest first. While the resident set size is past the high
+    water mark, the client pauses requesting the next days and the buffers
+    are flushed at most once per flush_interval, since CPython rarely
+    returns freed memory to the system.
+    """
+
+    def __init__(
+        self,
+        max_rss: int,
+        high_water: float = HIGH_WATER,
+        buffer_share: float = BUFFER_SHARE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize memory governor.
+
+        Arguments:
+            max_rss {int} -- Memory ceiling in bytes
+
+        Keyword Arguments:
+            high_water {float} -- Part of the ceiling after which the memory
+                is relieved (default: HIGH_WATER)
+            buffer_share {float} -- Part of the ceiling which may be held in
+                registered buffers (default: BUFFER_SHARE)
+            flush_interval {float} -- Minimum seconds between flushes while
+                only the RSS is high (default: FLUSH_INTERVAL)
+        """
+        self.max_rss: int = max_rss
+        self.high_water: int = int(high_water * max_rss)
+        self.max_buffered: int = int(buffer_share * max_rss)
+        self.buffers: Dict[str, Tuple[Callable[[], int], Callable]] = {}
+        self.flush_interval: float = flush_interval
+        self.flushed: float = float('-inf')
+        self.peak: int = 0
+        self.flushes: int = 0
+        self.exceeded: bool = False
+        self.lock: threading.RLock = threading.RLock()
+
+    def register(
+        self,
+        name: str,
+        size: Callable[[], int],
+        flush: Callable[[], Any],
+    ) -> None:
+        """Register a buffer which can be flushed under memory pressure.
+
+        Arguments:
+            name {str} -- Name of the buffer
+            size {Callable[[], int]} -- Returns the buffered bytes
+            flush {Callable[[], Any]} -- Flushes the buffer
+        """
+        with self.lock:
+            self.buffers[name] = (size, flush)
+
+    def unregister(self, name: str) -> None:
+        """Unregister a buffer.
+
+        Arguments:
+            name {str} -- Name of the buffer
+        """
+        with self.lock:
+            self.buffers.pop(name, None)
+
+    def rss(self) -> int:
+        """Resident set size, which is also saved as peak.
+
+        Returns:
+            int -- Resident set size in bytes
+        """
+        rss: int = current_rss()
+        self.peak = max(self.peak, rss)
+        return rss
+
+    def buffered(self) -> int:
+        """Total size of the registered buffers.
+
+        Returns:
+            int -- Buffered bytes
+        """
+        with self.lock:
+            return sum(size() for size, _ in self.buffers.values())
+
+    def relieve(self) -> bool:
+        """Flush the buffers when the memory is under pressure.
+
+        Returns:
+            bool -- Whether the memory was under pressure
+        """
+        buffers_full: bool = self.buffered() >= self.max_buffered
+        if not buffers_full and self.rss() < self.high_water:
+            return False
+
+        # Flushing does not lower the RSS right away, so it is not repeated
+        # for every check while only the RSS is high
+        now: float = time.monotonic()
+        if not buffers_full and now - self.flushed < self.flush_interval:
+            return True
+
+        with self.lock:
+            buffers: list = sorted(
+                self.buffers.values(),
+                key=lambda buffer: buffer[0](),
+                reverse=True,
+            )
+            for _, flush in buffers:
+                flush()
+            self.flushes += 1
+            self.flushed = now
+
+        # Warn once per excess, the memory can not be relieved any further
+        rss: int = self.rss()
+        if rss > self.max_rss and not self.exceeded:
+            LOGGER.warning(
+                f'Memory of {rss} bytes exceeds the ceiling of '
+                f'{self.max_rss} bytes after flushing the buffers',
+            )
+        self.exceeded = rss > self.max_rss
+        return True
+
+    def summary(self) -> dict:
+        """Memory usage of the run.
+
+        Returns:
+            dict -- Peak resident set size and number of flushes
+        """
+        return {'peak_rss': self.peak, 'memory_flushes': self.flushes}
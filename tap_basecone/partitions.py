@@ -0,0 +1,146 @@
+"""Lease based coordination of date partitions."""
+# -*- coding: utf-8 -*-
+import os
+import socket
+import sqlite3
+import time
+from typing import Iterable, List, Optional
+
+# Default duration of a lease: 1 hour
+LEASE_SECONDS: float = 3600
+CLAIMED: str = 'claimed'
+COMPLETE: str = 'complete'
+
+
+class LeaseTable(object):
+    """Lease table in a shared SQLite database.
+
+    Every partition, e.g. a day, is claimed by one node at a time. A claim
+    expires after lease_seconds, so partitions of a crashed node are claimed
+    again by another node. A node renews the claims it still holds, since
+    they are only completed once their rows are written. A completed
+    partition is never claimed again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        node_id: Optional[str] = None,
+        lease_seconds: float = LEASE_SECONDS,
+    ) -> None:
+        """Initialize lease table.
+
+        Arguments:
+            path {str} -- Path to the SQLite database
+
+        Keyword Arguments:
+            node_id {Optional[str]} -- Name of this node, defaults to the
+                hostname and process id (default: {None})
+            lease_seconds {float} -- Duration of a lease (default: LEASE_SECONDS)
+        """
+        self.node_id: str = node_id or f'{socket.gethostname()}-{os.getpid()}'
+        self.lease_seconds: float = lease_seconds
+
+        # Transactions are started explicitly to lock the database
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            path,
+            timeout=60,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS partitions ('
+            'partition TEXT PRIMARY KEY, '
+            'node TEXT NOT NULL, '
+            'status TEXT NOT NULL, '
+            'expires REAL NOT NULL)',
+        )
+
+    def claim(self, partition: str) -> Optional[bool]:
+        """Claim a partition.
+
+        Arguments:
+            partition {str} -- Partition, e.g. 2021-01-01
+
+        Returns:
+            Optional[bool] -- True if claimed, None if complete and False if
+                claimed by another node
+        """
+        now: float = time.time()
+
+        self.connection.execute('BEGIN IMMEDIATE')
+        try:
+            row: Optional[tuple] = self.connection.execute(
+                'SELECT node, status, expires FROM partitions '
+                'WHERE partition = ?',
+                (partition,),
+            ).fetchone()
+
+            if row is not None:
+                node, status, expires = row
+                if status == COMPLETE:
+                    return None
+                elif node != self.node_id and expires > now:
+                    return False
+
+            self.connection.execute(
+                'INSERT OR REPLACE INTO partitions '
+                '(partition, node, status, expires) VALUES (?, ?, ?, ?)',
+                (partition, self.node_id, CLAIMED, now + self.lease_seconds),
+            )
+            return True
+        finally:
+            self.connection.execute('COMMIT')
+
+    def renew(self, partitions: Iterable[str]) -> List[str]:
+        """Extend the leases of claimed partitions.
+
+        Arguments:
+            partitions {Iterable[str]} -- Partitions, e.g. 2021-01-01
+
+        Returns:
+            List[str] -- Partitions whose lease is lost to another node
+        """
+        expires: float = time.time() + self.lease_seconds
+        lost: List[str] = []
+
+        self.connection.execute('BEGIN IMMEDIATE')
+        try:
+            for partition in partitions:
+                renewed: int = self.connection.execute(
+                    'UPDATE partitions SET expires = ? '
+                    'WHERE partition = ? AND node = ? AND status = ?',
+                    (expires, partition, self.node_id, CLAIMED),
+                ).rowcount
+                if not renewed:
+                    lost.append(partition)
+        finally:
+            self.connection.execute('COMMIT')
+        return lost
+
+    def complete(self, partition: str) -> bool:
+        """Mark a claimed partition as complete.
+
+        Arguments:
+            partition {str} -- Partition, e.g. 2021-01-01
+
+        Returns:
+            bool -- False if the lease is lost to another node
+        """
+        return self.connection.execute(
+            'UPDATE partitions SET status = ? '
+            'WHERE partition = ? AND node = ? AND status = ?',
+            (COMPLETE, partition, self.node_id, CLAIMED),
+        ).rowcount > 0
+
+    def release(self, partition: str) -> None:
+        """Release a claimed partition, so another node can claim it.
+
+        Arguments:
+            partition {str} -- Partition, e.g. 2021-01-01
+        """
+        self.connection.execute(
+            'DELETE FROM partitions '
+            'WHERE partition = ? AND node = ? AND status = ?',
+            (partition, self.node_id, CLAIMED),
+        )
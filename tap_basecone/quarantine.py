@@ -0,0 +1,79 @@
+"""Dead-letter quarantine of rows which could not be cleaned."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+from datetime import datetime, timezone
+from typing import IO, Optional
+
+import singer
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+
+class ErrorBudgetError(ValueError):
+    """Too many rows were quarantined."""
+
+
+class DeadLetter(object):
+    """Write rows which could not be cleaned to a JSONL file."""
+
+    def __init__(self, path: str, max_errors: Optional[int] = None) -> None:
+        """Initialize dead-letter file.
+
+        Arguments:
+            path {str} -- Path to the JSONL file, rows are appended
+
+        Keyword Arguments:
+            max_errors {Optional[int]} -- Number of quarantined rows after
+                which the run fails (default: {None})
+        """
+        self.path: str = path
+        self.max_errors: Optional[int] = max_errors
+        self.count: int = 0
+        self.file: Optional[IO[str]] = None
+
+    def write(
+        self,
+        stream_name: str,
+        date_day: str,
+        row: dict,
+        error: Exception,
+    ) -> None:
+        """Quarantine a row.
+
+        Arguments:
+            stream_name {str} -- Stream name
+            date_day {str} -- Day of the request
+            row {dict} -- Raw row
+            error {Exception} -- Error while cleaning the row
+
+        Raises:
+            ErrorBudgetError: The error budget is spent
+        """
+        if self.file is None:
+            self.file = open(self.path, 'a')  # noqa: WPS515
+
+        self.count += 1
+        LOGGER.warning(f'Quarantined row of {stream_name} on {date_day}: {error}')
+
+        self.file.write(json.dumps({
+            'stream': stream_name,
+            'date': date_day,
+            'error': str(error),
+            'error_type': type(error).__name__,
+            'quarantined_at': datetime.now(timezone.utc).isoformat(),
+            'row': row,
+        }, default=str) + '\n')
+        self.file.flush()
+
+        if self.max_errors is not None and self.count > self.max_errors:
+            raise ErrorBudgetError(
+                f'Quarantined {self.count} rows, more than the maximum of '
+                f'{self.max_errors}, see {self.path}',
+            )
+
+    def close(self) -> None:
+        """Close the dead-letter file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
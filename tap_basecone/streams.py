@@ -1,6 +1,7 @@
 """Streams metadata."""
 # -*- coding: utf-8 -*-
 from datetime import datetime
+from functools import lru_cache
 from types import MappingProxyType
 
 from dateutil.parser import parse as parse_date
@@ -238,9 +239,12 @@ TIMEZONES: MappingProxyType = MappingProxyType({
 })
 
 
+@lru_cache(maxsize=4096)
 def date_parser(input_date: str) -> str:
     """Help function to parse timezones correctly in strings.
 
+    Dates repeat a lot between transactions, so the results are cached.
+
     Arguments:
         input_date {str} -- Input date as string
 
@@ -341,5 +345,51 @@ STREAMS: MappingProxyType = MappingProxyType({
                 'map': 'book_year', 'type': int, 'null': False,
             }
         }
-    }
+    },
+    # Dimension streams are emitted by their parent stream when the config
+    # option normalize_dimensions is enabled. Every reference maps the columns
+    # of a parent row to the columns of the dimension.
+    'supplier': {
+        'key_properties': 'supplier_id',
+        'replication_method': 'FULL_TABLE',
+        'parent': 'transaction_collection',
+        'references': (
+            {
+                'supplier_id': 'supplier_id',
+                'supplier_code': 'supplier_code',
+                'supplier_name': 'supplier_name',
+            },
+        ),
+    },
+    'general_ledger': {
+        'key_properties': 'generalledger_id',
+        'replication_method': 'FULL_TABLE',
+        'parent': 'transaction_collection',
+        'references': (
+            {
+                'generalledger_id': 'generalledger_id',
+                'generalledger_code': 'generalledger_code',
+            },
+        ),
+    },
+    'currency': {
+        'key_properties': 'currency_id',
+        'replication_method': 'FULL_TABLE',
+        'parent': 'transaction_collection',
+        'references': (
+            {
+                'currency_id': 'currency_id',
+                'currency_code': 'currency_code',
+            },
+        ),
+    },
+    'company': {
+        'key_properties': 'company_code',
+        'replication_method': 'FULL_TABLE',
+        'parent': 'transaction_collection',
+        'references': (
+            {'target_company': 'company_code'},
+            {'destination_company': 'company_code'},
+        ),
+    },
 })
@@ -0,0 +1,177 @@
+"""Typed structs of Basecone responses.
+
+The structs are only available when msgspec is installed. The response bytes
+are then decoded straight into structs, instead of nested dictionaries.
+"""
+# -*- coding: utf-8 -*-
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Union,
+)
+
+try:
+    import msgspec  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    msgspec = None  # noqa: WPS440
+
+# Codes and numbers which are sent as number or as string
+Code = Union[int, str, None]
+
+
+if msgspec is not None:
+
+    class Supplier(msgspec.Struct):
+        """Supplier of a transaction."""
+
+        supplierId: Optional[str] = None  # noqa: N815
+        code: Code = None
+        name: Optional[str] = None
+
+    class GeneralLedger(msgspec.Struct):
+        """General ledger of a transaction."""
+
+        generalLedgerId: Optional[str] = None  # noqa: N815
+        code: Code = None
+
+    class Currency(msgspec.Struct):
+        """Currency of a transaction."""
+
+        currencyId: Optional[str] = None  # noqa: N815
+        code: Optional[str] = None
+
+    class Company(msgspec.Struct):
+        """Target or destination company of a transaction."""
+
+        code: Code = None
+
+    class Transaction(msgspec.Struct):  # noqa: WPS230
+        """Basecone transaction."""
+
+        type: Optional[str] = None  # noqa: WPS125
+        description: Optional[str] = None
+        dueDate: Optional[str] = None  # noqa: N815
+        invoiceNumber: Optional[str] = None  # noqa: N815
+        purchaseOrderNumber: Optional[str] = None  # noqa: N815
+        supplier: Optional[Supplier] = None
+        paymentCondition: Optional[Dict[str, Any]] = None  # noqa: N815
+        isInPaymentBatch: Optional[bool] = None  # noqa: N815
+        isCreditNote: Optional[bool] = None  # noqa: N815
+        totalAmount: Union[int, float, None] = None  # noqa: N815
+        transactionId: Optional[str] = None  # noqa: N815
+        documentId: Optional[str] = None  # noqa: N815
+        targetCompany: Optional[Company] = None  # noqa: N815
+        destinationCompany: Optional[Company] = None  # noqa: N815
+        transactionNumber: Code = None  # noqa: N815
+        transactionDate: Optional[str] = None  # noqa: N815
+        generalLedger: Optional[GeneralLedger] = None  # noqa: N815
+        period: Code = None
+        currency: Optional[Currency] = None
+        additionalField1: Optional[str] = None  # noqa: N815
+        additionalField2: Optional[str] = None  # noqa: N815
+        additionalField3: Optional[str] = None  # noqa: N815
+        isFinalBooking: Optional[bool] = None  # noqa: N815
+        bookYear: Code = None  # noqa: N815
+
+    class TransactionCollection(msgspec.Struct):
+        """Response of the transactions endpoint."""
+
+        transactions: List[Transaction] = []
+
+    DECODERS: dict = {
+        'transaction_collection': msgspec.json.Decoder(TransactionCollection),
+    }
+    DecodeError: Any = msgspec.DecodeError
+else:
+    DECODERS = {}  # noqa: WPS440
+    DecodeError = ValueError  # noqa: WPS440
+
+# Whitespace and separators between the items of an array
+SEPARATORS: Pattern = re.compile(r'[\s,]*')
+JSON_DECODER: json.JSONDecoder = json.JSONDecoder()
+
+
+def to_builtins(row: Any) -> Any:
+    """Convert a decoded struct to builtin types.
+
+    Arguments:
+        row {Any} -- Struct or dictionary
+
+    Returns:
+        Any -- Dictionary
+    """
+    if msgspec is None or isinstance(row, dict):
+        return row
+    return msgspec.to_builtins(row)
+
+
+def iter_items(  # noqa: WPS231
+    chunks: Iterable[bytes],
+    key: str,
+) -> Generator[dict, None, None]:
+    """Incrementally decode the items of an array in a JSON object.
+
+    Only the current chunk and the current item are held in memory, e.g. the
+    transactions of {"transactions": [{...}, {...}]} are decoded one by one
+    while the response is received. The items have to be objects, since a
+    number split over two chunks would decode as two numbers.
+
+    Arguments:
+        chunks {Iterable[bytes]} -- Chunks of the JSON document
+        key {str} -- Key of the array
+
+    Raises:
+        ValueError: The document does not contain the array of objects, or
+            ends early
+
+    Yields:
+        Generator[dict] -- Items of the array
+    """
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+        'utf-8',
+    )()
+    start: Pattern = re.compile(f'"{re.escape(key)}"\\s*:\\s*\\[')
+    buffer: str = ''
+    in_array: bool = False
+
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+
+        if not in_array:
+            match: Optional[Any] = start.search(buffer)
+            if match is None:
+                continue
+            buffer = buffer[match.end():]
+            in_array = True
+
+        # Decode the items from an offset, the buffer is trimmed once per
+        # chunk instead of copied for every item
+        index: int = 0
+        while True:
+            index = SEPARATORS.match(buffer, index).end()
+            first: str = buffer[index:index + 1]
+            if first == ']':
+                return
+            elif not first:
+                break
+            elif first != '{':
+                raise ValueError(f'Items of {key} are not objects')
+
+            try:
+                item, index = JSON_DECODER.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                # The item continues in the next chunk
+                break
+            yield item
+
+        buffer = buffer[index:]
+
+    raise ValueError(f'Incomplete JSON array: {key}')
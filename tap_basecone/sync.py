@@ -1,24 +1,33 @@
 """Sync data."""
 # -*- coding: utf-8 -*-
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 import singer
+from singer import metadata
 from singer.catalog import Catalog, CatalogEntry
 
 from tap_basecone import tools
 from tap_basecone.basecone import Basecone
+from tap_basecone.batch import BatchWriter
+from tap_basecone.cleaners import build_cleaner, split_dimensions
 from tap_basecone.streams import STREAMS
 
 LOGGER: logging.RootLogger = singer.get_logger()
 
+# Serializes the Singer messages and state changes of concurrent streams
+OUTPUT_LOCK: threading.RLock = threading.RLock()
+
 
 def sync(
     basecone: Basecone,
     state: dict,
     catalog: Catalog,
-    start_date: str,
+    start_date: Optional[str],
+    config: Optional[dict] = None,
 ) -> None:
     """Sync data from tap source.
 
@@ -26,65 +35,266 @@ def sync(
         basecone {Basecone} -- Basecone client
         state {dict} -- Tap state
         catalog {Catalog} -- Stream catalog
-        start_date {str} -- Start date
+        start_date {Optional[str]} -- Start date without state
+
+    Keyword Arguments:
+        config {Optional[dict]} -- Tap configuration (default: {None})
     """
+    config = config or {}
     # For every stream in the catalog
     LOGGER.info('Sync')
     LOGGER.debug('Current state:\n{state}')
 
     # Only selected streams are synced, whether a stream is selected is
     # determined by whether the key-value: "selected": true is in the schema
-    # file.
-    for stream in catalog.get_selected_streams(state):
-        LOGGER.info(f'Syncing stream: {stream.tap_stream_id}')
+    # file. Dimension streams are synced together with their parent stream.
+    streams: List[CatalogEntry] = [
+        stream for stream in catalog.get_selected_streams(state)
+        if not STREAMS[stream.tap_stream_id].get('parent')
+    ]
+
+    # Dimension streams are only split from their parent when normalized,
+    # warn when one is explicitly selected in the catalog metadata
+    if not config.get('normalize_dimensions'):
+        for stream in catalog.get_selected_streams(state):
+            explicitly_selected: bool = metadata.get(
+                metadata.to_map(stream.metadata or []),
+                (),
+                'selected',
+            ) is True
+            if STREAMS[stream.tap_stream_id].get('parent') and (
+                explicitly_selected
+            ):
+                LOGGER.warning(
+                    f'Stream {stream.tap_stream_id} is selected, but only '
+                    'synced with normalize_dimensions enabled, skipping.',
+                )
+
+    # Independent streams are synced concurrently, only the transaction
+    # collection is such a stream yet, the dimension streams are synced with
+    # their parent
+    concurrency: int = int(config.get('stream_concurrency', 1))
+
+    if concurrency > 1 and len(streams) > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures: List[Future] = [
+                executor.submit(
+                    sync_stream,
+                    basecone,
+                    state,
+                    catalog,
+                    stream,
+                    start_date,
+                    config,
+                )
+                for stream in streams
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for stream in streams:
+            # Update the current stream as active syncing in the state, which
+            # only names a single stream when they are synced in order
+            singer.set_currently_syncing(state, stream.tap_stream_id)
+            sync_stream(basecone, state, catalog, stream, start_date, config)
+
+    LOGGER.info(f'Run summary: {basecone.summary()}')
 
-        # Update the current stream as active syncing in the state
-        singer.set_currently_syncing(state, stream.tap_stream_id)
 
-        # Retrieve the state of the stream
+def sync_stream(  # noqa: WPS210
+    basecone: Basecone,
+    state: dict,
+    catalog: Catalog,
+    stream: CatalogEntry,
+    start_date: Optional[str],
+    config: dict,
+) -> None:
+    """Sync a stream.
+
+    Streams can be synced concurrently, so all messages are written while
+    holding the OUTPUT_LOCK.
+
+    Arguments:
+        basecone {Basecone} -- Basecone client
+        state {dict} -- Tap state
+        catalog {Catalog} -- Stream catalog
+        stream {CatalogEntry} -- Stream to sync
+        start_date {Optional[str]} -- Start date without state
+        config {dict} -- Tap configuration
+    """
+    LOGGER.info(f'Syncing stream: {stream.tap_stream_id}')
+
+    with OUTPUT_LOCK:
+        # Retrieve the state of the stream, or start from the start_date
         stream_state: dict = tools.get_stream_state(
             state,
             stream.tap_stream_id,
-        )
+        ) or {'start_date': (start_date or '')[:10]}
 
-        LOGGER.info(f'Stream state: {stream_state}')
+    LOGGER.info(f'Stream state: {stream_state}')
 
-        # Write the schema
+    # In normalized mode the selected dimension streams are split from
+    # the rows of this stream
+    dimensions: List[CatalogEntry] = []
+    if config.get('normalize_dimensions'):
+        dimensions = get_selected_dimensions(catalog, stream)
+
+    # Write the schemas before any record of the stream
+    with OUTPUT_LOCK:
         singer.write_schema(
             stream_name=stream.tap_stream_id,
             schema=stream.schema.to_dict(),
             key_properties=stream.key_properties,
         )
 
-        # Every stream has a corresponding method in the PayPal object e.g.:
-        # The stream: paypal_transactions will call: paypal.paypal_transactions
-        tap_data: Callable = getattr(basecone, stream.tap_stream_id)
+        for dimension in dimensions:
+            singer.write_schema(
+                stream_name=dimension.tap_stream_id,
+                schema=dimension.schema.to_dict(),
+                key_properties=dimension.key_properties,
+            )
+
+    # Only the selected properties are cleaned, including the columns of
+    # the selected dimensions
+    properties: Set[str] = tools.get_selected_properties(stream)
+    for dimension in dimensions:
+        for reference in STREAMS[dimension.tap_stream_id]['references']:
+            properties.update(reference)
+
+    basecone.cleaners[stream.tap_stream_id] = build_cleaner(
+        stream.tap_stream_id,
+        frozenset(properties),
+    )
+
+    # Every dimension entity is only emitted once per run
+    seen: Dict[str, Set[Any]] = {
+        dimension.tap_stream_id: set() for dimension in dimensions
+    }
+
+    # Every stream has a corresponding method in the PayPal object e.g.:
+    # The stream: paypal_transactions will call: paypal.paypal_transactions
+    tap_data: Callable = getattr(basecone, stream.tap_stream_id)
+
+    # The tap_data method yields rows of data from the API
+    # The state of the stream is used as kwargs for the method
+    # E.g. if the state of the stream has a key 'start_date', it will be
+    # used in the method as start_date='2021-01-01T00:00:00+0000'
+    rows: Iterator[dict] = tap_data(**stream_state)
+
+    if dimensions:
+        rows = (sync_dimensions(row, seen) for row in rows)
+
+    # In batch mode the rows are written to files instead of stdout
+    if config.get('batch_config'):
+        sync_batch(
+            basecone,
+            stream,
+            rows,
+            state,
+            BatchWriter(stream.tap_stream_id, config['batch_config']),
+        )
+    else:
+        for row in rows:
+            with OUTPUT_LOCK:
+                sync_record(stream, row)
+
+                # Write the state after every completely retrieved day
+                sync_checkpoint(basecone, stream, state)
 
-        # The tap_data method yields rows of data from the API
-        # The state of the stream is used as kwargs for the method
-        # E.g. if the state of the stream has a key 'start_date', it will be
-        # used in the method as start_date='2021-01-01T00:00:00+0000'
-        for row in tap_data(**stream_state):
-            sync_record(stream, row, state)
+    # Write the state after the last retrieved day
+    with OUTPUT_LOCK:
+        sync_checkpoint(basecone, stream, state)
 
 
-def sync_record(stream: CatalogEntry, row: dict, state: dict) -> None:
-    """Sync the record.
+def sync_checkpoint(
+    basecone: Basecone,
+    stream: CatalogEntry,
+    state: dict,
+) -> None:
+    """Write the state after a day is completely retrieved.
+
+    The Basecone client keeps the state to resume from after every retrieved
+    day. The state is only written once for every new checkpoint. It is only
+    called once the rows of the retrieved days are written, since the leases
+    of the days are then completed.
 
     Arguments:
+        basecone {Basecone} -- Basecone client
         stream {CatalogEntry} -- Stream catalog
-        row {dict} -- Record
         state {dict} -- State
     """
-    # Retrieve the value of the bookmark
-    bookmark: Optional[str] = tools.get_bookmark_value(
-        stream.tap_stream_id,
-        row,
-    )
+    checkpoint: Optional[dict] = basecone.commit(stream.tap_stream_id)
+    if not checkpoint:
+        return
 
-    # Create new bookmark
-    new_bookmark: str = tools.create_bookmark(stream.tap_stream_id, bookmark)
+    # The checkpoint replaces the state of the stream, since keys of the
+    # freshness mode are removed once the backlog is retrieved
+    state.setdefault('bookmarks', {})[stream.tap_stream_id] = checkpoint
 
+    # Clear currently syncing
+    tools.clear_currently_syncing(state)
+
+    singer.write_state(state)
+
+
+def get_selected_dimensions(
+    catalog: Catalog,
+    stream: CatalogEntry,
+) -> List[CatalogEntry]:
+    """Return the selected dimension streams of a stream.
+
+    Arguments:
+        catalog {Catalog} -- Stream catalog
+        stream {CatalogEntry} -- Parent stream
+
+    Returns:
+        List[CatalogEntry] -- Selected dimension streams
+    """
+    return [
+        entry for entry in catalog.streams
+        if STREAMS.get(entry.tap_stream_id, {}).get('parent') == (
+            stream.tap_stream_id
+        ) and entry.is_selected()
+    ]
+
+
+def sync_dimensions(row: dict, seen: Dict[str, Set[Any]]) -> dict:
+    """Write the unseen dimension entities of a row.
+
+    Arguments:
+        row {dict} -- Record
+        seen {Dict[str, Set[Any]]} -- Seen dimension keys per stream
+
+    Returns:
+        dict -- Record with only the foreign keys of the dimensions
+    """
+    fact, dimension_rows = split_dimensions(row, seen.keys())
+
+    for stream_name, dimension_row in dimension_rows:
+        # Every entity is emitted once per run, identified by its key
+        entity: Any = dimension_row[STREAMS[stream_name]['key_properties']]
+
+        if entity in seen[stream_name]:
+            continue
+
+        seen[stream_name].add(entity)
+        with OUTPUT_LOCK:
+            singer.write_record(
+                stream_name,
+                dimension_row,
+                time_extracted=datetime.now(timezone.utc),
+            )
+
+    return fact
+
+
+def sync_record(stream: CatalogEntry, row: dict) -> None:
+    """Sync the record.
+
+    Arguments:
+        stream {CatalogEntry} -- Stream catalog
+        row {dict} -- Record
+    """
     # Write a row to the stream
     singer.write_record(
         stream.tap_stream_id,
@@ -92,17 +302,36 @@ def sync_record(stream: CatalogEntry, row: dict, state: dict) -> None:
         time_extracted=datetime.now(timezone.utc),
     )
 
-    if new_bookmark:
-        # Save the bookmark to the state
-        singer.write_bookmark(
-            state,
-            stream.tap_stream_id,
-            STREAMS[stream.tap_stream_id]['bookmark'],
-            new_bookmark,
-        )
 
-        # Clear currently syncing
-        tools.clear_currently_syncing(state)
+def sync_batch(
+    basecone: Basecone,
+    stream: CatalogEntry,
+    rows: Iterator[dict],
+    state: dict,
+    writer: BatchWriter,
+) -> None:
+    """Sync the records through BATCH files.
+
+    The state is only written after a file is durably written. Since a file
+    is only finished before the next row is written, all rows of the days in
+    the checkpoint are part of the written files.
+
+    Arguments:
+        basecone {Basecone} -- Basecone client
+        stream {CatalogEntry} -- Stream catalog
+        rows {Iterator[dict]} -- Records
+        state {dict} -- State
+        writer {BatchWriter} -- Batch file writer
+    """
+    for row in rows:
+        # Finish a full file before the row is written to a new file
+        if writer.full():
+            with OUTPUT_LOCK:
+                writer.flush()
+                sync_checkpoint(basecone, stream, state)
+
+        writer.write_record(row)
 
-        # Write the bootmark
-        singer.write_state(state)
+    with OUTPUT_LOCK:
+        if writer.flush():
+            sync_checkpoint(basecone, stream, state)
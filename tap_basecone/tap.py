@@ -2,13 +2,19 @@
 # -*- coding: utf-8 -*-
 import logging
 from argparse import Namespace
+from typing import Optional
 
 import pkg_resources
 from singer import get_logger, utils
 from singer.catalog import Catalog
 
-from tap_basecone.basecone import Basecone
+from tap_basecone.basecone import Basecone, RateLimiter
+from tap_basecone.daemon import Daemon
 from tap_basecone.discover import discover
+from tap_basecone.export import export
+from tap_basecone.memory import MemoryGovernor
+from tap_basecone.partitions import LEASE_SECONDS, LeaseTable
+from tap_basecone.quarantine import DeadLetter
 from tap_basecone.sync import sync
 
 VERSION: str = pkg_resources.get_distribution('tap-basecone').version
@@ -41,13 +47,83 @@ def main() -> None:
         # Loadt the  catalog
         catalog = discover()
 
+    # Share the days with other nodes through a lease table
+    leases: Optional[LeaseTable] = None
+    if args.config.get('partition_lease_path'):
+        leases = LeaseTable(
+            args.config['partition_lease_path'],
+            node_id=args.config.get('node_id'),
+            lease_seconds=args.config.get('lease_seconds', LEASE_SECONDS),
+        )
+
+    # Quarantine rows which can not be cleaned
+    dead_letter: Optional[DeadLetter] = None
+    if args.config.get('dead_letter_path'):
+        dead_letter = DeadLetter(
+            args.config['dead_letter_path'],
+            max_errors=args.config.get('max_dead_letters'),
+        )
+
+    # Limit the rate of requests of all streams
+    rate_limiter: Optional[RateLimiter] = None
+    if args.config.get('max_requests_per_second'):
+        rate_limiter = RateLimiter(args.config['max_requests_per_second'])
+
+    # Keep the memory below a ceiling
+    memory: Optional[MemoryGovernor] = None
+    if args.config.get('max_rss_mb'):
+        memory = MemoryGovernor(int(args.config['max_rss_mb']) * 1024 * 1024)
+
     # Initialize basecone client
     basecone: Basecone = Basecone(
         args.config['company_id'],
         args.config['auth_token'],
+        max_runtime=args.config.get('max_runtime'),
+        max_requests=args.config.get('max_requests'),
+        freshness_days=args.config.get('freshness_days'),
+        end_date=(args.config.get('end_date') or '')[:10] or None,
+        leases=leases,
+        hedge_percentile=args.config.get('hedge_percentile'),
+        hedge_max_ratio=args.config.get('hedge_max_ratio', 0.1),
+        dead_letter=dead_letter,
+        typed_decoding=args.config.get('typed_decoding', False),
+        rate_limiter=rate_limiter,
+        max_concurrency=args.config.get('max_concurrency'),
+        memory=memory,
     )
 
-    sync(basecone, args.state, catalog, args.config['start_date'])
+    try:
+        run(basecone, args.state, catalog, args.config)
+    finally:
+        if dead_letter:
+            dead_letter.close()
+
+
+def run(
+    basecone: Basecone,
+    state: dict,
+    catalog: Catalog,
+    config: dict,
+) -> None:
+    """Run the tap in export, daemon or sync mode.
+
+    Arguments:
+        basecone {Basecone} -- Basecone client
+        state {dict} -- Tap state
+        catalog {Catalog} -- Stream catalog
+        config {dict} -- Tap configuration
+    """
+    # Export mode writes Parquet files instead of Singer messages
+    if config.get('export_path'):
+        export(basecone, state, catalog, config)
+        return
+
+    # Daemon mode keeps the client alive and runs syncs on a schedule
+    if config.get('daemon_output_dir'):
+        Daemon(basecone, state, catalog, config).run()
+        return
+
+    sync(basecone, state, catalog, config.get('start_date'), config)
 
 
 if __name__ == '__main__':
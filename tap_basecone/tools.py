@@ -1,8 +1,9 @@
 """Tools."""
 # -*- coding: utf-8 -*-
-from datetime import date, datetime, timedelta
-from functools import reduce
-from typing import Optional
+from typing import Optional, Set
+
+from singer import metadata
+from singer.catalog import CatalogEntry
 
 
 def clear_currently_syncing(state: dict) -> dict:
@@ -33,41 +34,37 @@ def get_stream_state(state: dict, tap_stream_id: str) -> dict:
     ).get(tap_stream_id)
 
 
-def create_bookmark(stream_name: str, bookmark_value: str) -> str:
-    """Create bookmark.
+def get_selected_properties(stream: CatalogEntry) -> Set[str]:
+    """Retrieve the selected properties of a stream from the catalog.
+
+    A property is selected when its inclusion is automatic, or when it is
+    selected in the metadata. Properties without a selection in the metadata
+    are selected, unless they are not selected by default.
 
     Arguments:
-        stream_name {str} -- Name of stream
-        bookmark_value {str} -- Bookmark value
+        stream {CatalogEntry} -- Stream catalog
 
     Returns:
-        str -- Created bookmark
+        Set[str] -- Selected properties
     """
-    if stream_name in {
-        'transaction_collection',
-    }:
-        # Return tomorrow's date
-        tomorrow: date = datetime.strptime(
-            bookmark_value,
-            '%Y-%m-%d',
-        ).date() + timedelta(days=1)
-        return tomorrow.isoformat()
-
-def get_bookmark_value(
-    stream_name: str,
-    row: dict,
-) -> Optional[str]:
-    """Retrieve bookmark value from record.
+    mdata: dict = metadata.to_map(stream.metadata or [])
+    properties: Set[str] = set()
 
-    Arguments:
-        stream_name {str} -- Stream name
-        row {dict} -- Record
+    for property_name in stream.schema.properties:
+        breadcrumb: tuple = ('properties', property_name)
+        inclusion: Optional[str] = metadata.get(mdata, breadcrumb, 'inclusion')
+        selected: Optional[bool] = metadata.get(mdata, breadcrumb, 'selected')
 
-    Returns:
-        str -- Bookmark value
-    """
-    if stream_name in {
-        'transaction_collection',
-    }:
-        # YYYY-MM
-        return row['transaction_date'].replace("T00:00:00", "")
\ No newline at end of file
+        if selected is None:
+            selected = metadata.get(
+                mdata,
+                breadcrumb,
+                'selected-by-default',
+            ) is not False
+
+        if inclusion == 'automatic' or (
+            inclusion != 'unsupported' and selected
+        ):
+            properties.add(property_name)
+
+    return properties
@@ -0,0 +1,44 @@
+"""Tests of the asynchronous Basecone client."""
+# -*- coding: utf-8 -*-
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from tap_basecone.basecone import AsyncBasecone
+
+
+def test_retry_rate_limited_day():
+    """A rate limited day is requested again after the Retry-After."""
+    statuses: list = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            statuses.pop(0),
+            headers={'Retry-After': '0'},
+            json={'transactions': []},
+        )
+
+    async def collect() -> list:
+        basecone: AsyncBasecone = AsyncBasecone('company', 'token')
+        basecone.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+        )
+        today: str = datetime.utcnow().date().isoformat()
+        rows: list = [
+            row async for row in basecone.transaction_collection(
+                start_date=today,
+            )
+        ]
+        await basecone.aclose()
+        return rows
+
+    assert asyncio.run(collect()) == []
+    assert not statuses
+
+
+def test_unsupported_options():
+    """The options which require threads are rejected."""
+    with pytest.raises(ValueError):
+        AsyncBasecone('company', 'token', max_concurrency=4)
@@ -0,0 +1,33 @@
+"""Tests of the adaptive concurrency of the requests."""
+# -*- coding: utf-8 -*-
+from tap_basecone.basecone import AdaptiveConcurrency
+
+
+def test_increase_and_decrease():
+    """The limit grows on healthy responses and halves on rate limits."""
+    concurrency: AdaptiveConcurrency = AdaptiveConcurrency(8)
+
+    for _ in range(100):
+        concurrency.on_response(0.01, 200)
+    assert concurrency.current == 8
+
+    concurrency.on_response(0.01, 429)
+    assert concurrency.current == 4
+
+
+def test_recovery_after_level_shift():
+    """A lasting change of the response time is no spike after a while."""
+    concurrency: AdaptiveConcurrency = AdaptiveConcurrency(8)
+
+    for _ in range(100):
+        concurrency.on_response(0.01, 200)
+
+    # The first slow responses are spikes
+    concurrency.on_response(0.1, 200)
+    assert concurrency.current == 4
+
+    # The baseline follows the slow responses, so the limit grows again
+    for _ in range(100):
+        concurrency.on_response(0.1, 200)
+    assert concurrency.current == 8
+    assert concurrency.latency > 0.05
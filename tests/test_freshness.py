@@ -0,0 +1,80 @@
+"""Tests of the retrieval of the recent days before the backlog."""
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+
+from tap_basecone.basecone import Basecone
+
+
+def days_ago(days: int) -> str:
+    """Return the UTC date of a number of days ago.
+
+    Arguments:
+        days {int} -- Number of days ago
+
+    Returns:
+        str -- Date in YYYY-MM-DD format
+    """
+    return (datetime.utcnow().date() - timedelta(days=days)).isoformat()
+
+
+def test_recent_days_before_backlog():
+    """The recent days are retrieved first, then the backlog in order."""
+    basecone: Basecone = Basecone('company', 'token', freshness_days=2)
+
+    states: list = list(basecone._transaction_days(start_date=days_ago(4)))
+
+    assert [date_day for date_day, _ in states] == [
+        days_ago(1),
+        days_ago(0),
+        days_ago(4),
+        days_ago(3),
+        days_ago(2),
+    ]
+    assert states[0][1] == {
+        'start_date': days_ago(4),
+        'fresh_date': days_ago(0),
+        'backlog_end_date': days_ago(1),
+    }
+    assert states[2][1] == {
+        'start_date': days_ago(3),
+        'fresh_date': days_ago(0),
+        'backlog_end_date': days_ago(1),
+    }
+
+    # The state collapses to the start_date after the last day of the backlog
+    assert states[-1][1] == {'start_date': days_ago(0)}
+
+
+def test_resume_mid_backlog():
+    """A run resumes the backlog after retrieving the recent days again."""
+    basecone: Basecone = Basecone('company', 'token', freshness_days=2)
+
+    states: list = list(basecone._transaction_days(
+        start_date=days_ago(3),
+        fresh_date=days_ago(0),
+        backlog_end_date=days_ago(1),
+    ))
+
+    assert [date_day for date_day, _ in states] == [
+        days_ago(0),
+        days_ago(3),
+        days_ago(2),
+    ]
+    assert states[1][1] == {
+        'start_date': days_ago(2),
+        'fresh_date': days_ago(0),
+        'backlog_end_date': days_ago(1),
+    }
+    assert states[-1][1] == {'start_date': days_ago(0)}
+
+
+def test_collapsed_state_retrieves_in_order():
+    """Without backlog, the days are retrieved in order from the start_date."""
+    basecone: Basecone = Basecone('company', 'token', freshness_days=2)
+
+    states: list = list(basecone._transaction_days(start_date=days_ago(1)))
+
+    assert states == [
+        (days_ago(1), {'start_date': days_ago(0)}),
+        (days_ago(0), {'start_date': days_ago(0)}),
+    ]
@@ -0,0 +1,163 @@
+"""Tests of the lease based coordination of date partitions."""
+# -*- coding: utf-8 -*-
+import time
+from datetime import datetime, timedelta
+
+from tap_basecone.basecone import Basecone
+from tap_basecone.partitions import LeaseTable
+
+
+def days_ago(days: int) -> str:
+    """Return the UTC date of a number of days ago.
+
+    Arguments:
+        days {int} -- Number of days ago
+
+    Returns:
+        str -- Date in YYYY-MM-DD format
+    """
+    return (datetime.utcnow().date() - timedelta(days=days)).isoformat()
+
+
+def node(path: str, node_id: str) -> Basecone:
+    """Create a Basecone client which shares the lease table.
+
+    Arguments:
+        path {str} -- Path to the lease table
+        node_id {str} -- Name of the node
+
+    Returns:
+        Basecone -- Basecone client
+    """
+    return Basecone('company', 'token', leases=LeaseTable(path, node_id))
+
+
+def test_claim_complete_release(tmp_path):
+    """A claimed partition is exclusive until released or completed."""
+    path: str = str(tmp_path / 'leases.db')
+    first: LeaseTable = LeaseTable(path, 'first')
+    second: LeaseTable = LeaseTable(path, 'second')
+
+    assert first.claim('2021-01-01') is True
+    assert first.claim('2021-01-01') is True
+    assert second.claim('2021-01-01') is False
+
+    first.release('2021-01-01')
+    assert second.claim('2021-01-01') is True
+
+    second.complete('2021-01-01')
+    assert first.claim('2021-01-01') is None
+    assert second.claim('2021-01-01') is None
+
+
+def test_expired_claim(tmp_path):
+    """The partition of a crashed node is claimed after its lease expires."""
+    path: str = str(tmp_path / 'leases.db')
+    crashed: LeaseTable = LeaseTable(path, 'crashed', lease_seconds=0.01)
+
+    assert crashed.claim('2021-01-01') is True
+    time.sleep(0.02)
+    assert LeaseTable(path, 'other').claim('2021-01-01') is True
+
+
+def test_partition_days_are_disjoint(tmp_path):
+    """Two nodes retrieve every past day exactly once."""
+    path: str = str(tmp_path / 'leases.db')
+    first: Basecone = node(path, 'first')
+    second: Basecone = node(path, 'second')
+    first.end_date = second.end_date = days_ago(1)
+
+    first_days: list = [
+        date_day for date_day, _ in first._partition_days(days_ago(5), {})
+    ]
+    second_days: list = [
+        date_day for date_day, _ in second._partition_days(days_ago(5), {})
+    ]
+
+    assert first_days == [days_ago(days) for days in range(5, 0, -1)]
+    assert second_days == []
+
+
+def test_partition_days_state(tmp_path):
+    """The state moves past the completed days, skipped days remain."""
+    path: str = str(tmp_path / 'leases.db')
+    other: LeaseTable = LeaseTable(path, 'other')
+    other.claim(days_ago(3))
+
+    basecone: Basecone = node(path, 'node')
+    basecone.end_date = days_ago(1)
+
+    states: list = list(basecone._partition_days(days_ago(4), {}))
+
+    assert [date_day for date_day, _ in states] == [
+        days_ago(4),
+        days_ago(2),
+        days_ago(1),
+    ]
+    assert states[-1][1] == {
+        'start_date': days_ago(3),
+        'partitions': {days_ago(2): 'complete', days_ago(1): 'complete'},
+    }
+
+
+def test_leases_complete_on_commit(tmp_path):
+    """Leases complete on commit, today is released to be retrieved again."""
+    path: str = str(tmp_path / 'leases.db')
+    first: Basecone = node(path, 'first')
+    other: LeaseTable = LeaseTable(path, 'other')
+
+    for date_day, checkpoint in first._partition_days(days_ago(1), {}):
+        first._day_completed('transaction_collection', date_day, checkpoint)
+
+    # Before the commit, the rows can still be lost with the first node
+    assert other.claim(days_ago(1)) is False
+
+    assert first.commit('transaction_collection') == {
+        'start_date': days_ago(0),
+        'partitions': {},
+    }
+    assert other.claim(days_ago(1)) is None
+    assert other.claim(days_ago(0)) is True
+
+
+def test_renew_and_lost_lease(tmp_path):
+    """A renewed lease is kept, a lost lease is not completed."""
+    path: str = str(tmp_path / 'leases.db')
+    first: LeaseTable = LeaseTable(path, 'first', lease_seconds=0.05)
+    second: LeaseTable = LeaseTable(path, 'second')
+
+    first.claim('2021-01-01')
+    first.claim('2021-01-02')
+    time.sleep(0.03)
+    assert first.renew(['2021-01-01']) == []
+    time.sleep(0.03)
+
+    # Only the lease which was not renewed expired
+    assert second.claim('2021-01-01') is False
+    assert second.claim('2021-01-02') is True
+
+    assert first.renew(['2021-01-01', '2021-01-02']) == ['2021-01-02']
+    assert first.complete('2021-01-02') is False
+    assert first.complete('2021-01-01') is True
+
+
+def test_uncommitted_leases_are_renewed(tmp_path):
+    """The leases of retrieved days are renewed until the commit."""
+    path: str = str(tmp_path / 'leases.db')
+    basecone: Basecone = Basecone(
+        'company',
+        'token',
+        leases=LeaseTable(path, 'first', lease_seconds=0.05),
+    )
+    other: LeaseTable = LeaseTable(path, 'other')
+
+    days: list = list(basecone._partition_days(days_ago(3), {}))
+    for date_day, checkpoint in days:
+        time.sleep(0.03)
+        basecone._day_completed('transaction_collection', date_day, checkpoint)
+
+    # The first day was claimed more than a lease ago
+    assert other.claim(days_ago(3)) is False
+
+    basecone.commit('transaction_collection')
+    assert other.claim(days_ago(3)) is None
@@ -0,0 +1,67 @@
+"""Tests of the incremental decoding of the responses."""
+# -*- coding: utf-8 -*-
+from typing import List
+
+import pytest
+
+from tap_basecone.structs import iter_items
+
+
+def split(document: bytes) -> List[List[bytes]]:
+    """Split a document in two chunks at every byte.
+
+    Arguments:
+        document {bytes} -- JSON document
+
+    Returns:
+        List[List[bytes]] -- Chunks for every split
+    """
+    return [
+        [document[:index], document[index:]]
+        for index in range(len(document) + 1)
+    ]
+
+
+def test_split_multibyte_characters():
+    """Characters split over two chunks are decoded."""
+    document: bytes = '{"transactions": [{"name": "Café €"}]}'.encode()
+
+    for chunks in split(document):
+        assert list(iter_items(chunks, 'transactions')) == [
+            {'name': 'Café €'},
+        ]
+
+
+def test_brackets_in_strings():
+    """A closing bracket in a string does not end the array."""
+    document: bytes = (
+        b'{"transactions": [{"name": "a]"}, {"name": "]}"}], "count": 2}'
+    )
+
+    for chunks in split(document):
+        assert list(iter_items(chunks, 'transactions')) == [
+            {'name': 'a]'},
+            {'name': ']}'},
+        ]
+
+
+def test_empty_array():
+    """An empty array has no items."""
+    for chunks in split(b'{"transactions": [ ]}'):
+        assert list(iter_items(chunks, 'transactions')) == []
+
+
+def test_truncated_body():
+    """A body which ends within the array raises an error."""
+    for chunks in split(b'{"transactions": [{"name": "a"}, {"na'):
+        with pytest.raises(ValueError):
+            list(iter_items(chunks, 'transactions'))
+
+    with pytest.raises(ValueError):
+        list(iter_items([b'{"other": []}'], 'transactions'))
+
+
+def test_scalar_items():
+    """Scalars, which can be split over two chunks, raise an error."""
+    with pytest.raises(ValueError):
+        list(iter_items([b'{"transactions": [12', b'34, 5]}'], 'transactions'))